@@ -5,7 +5,7 @@ Uses environment variables for credentials to enhance security.
 
 import os
 import mysql.connector
-from mysql.connector import Error, errorcode
+from mysql.connector import Error, errorcode, pooling
 from dotenv import load_dotenv
 import logging
 import hashlib
@@ -103,6 +103,35 @@ def test_connection():
     
     return False, "Unknown connection error"
 
+_connection_pool = None
+
+def get_connection_pool(pool_size=5):
+    """
+    Get the shared connection pool, creating it on first use.
+    
+    Pooled connections go back to the pool on close(), so models can keep
+    their connect/close-per-call pattern while reusing warm connections.
+    
+    Args:
+        pool_size (int): Number of pooled connections (used on first call only)
+        
+    Returns:
+        MySQLConnectionPool: Shared pool, or None if it could not be created
+    """
+    global _connection_pool
+    if _connection_pool is None:
+        try:
+            _connection_pool = pooling.MySQLConnectionPool(
+                pool_name='movie_rental_pool',
+                pool_size=pool_size,
+                **get_db_config()
+            )
+            logger.info(f"Connection pool created with {pool_size} connections")
+        except Error as e:
+            logger.error(f"Connection pool creation failed: {e}")
+            return None
+    return _connection_pool
+
 def hash_password(password):
     """
     Hash a password using SHA-256 with salt for secure storage.
@@ -25,6 +25,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Stored procedure definition version, kept in each procedure's COMMENT.
+# Bump it whenever a procedure changes so existing databases recreate it.
+PROCEDURES_VERSION = 2
+
 class DatabaseSetup:
     """Handles database creation and initialization."""
     
@@ -155,6 +159,7 @@ class DatabaseSetup:
                 INDEX idx_status (rental_status),
                 INDEX idx_due_date (due_date),
                 INDEX idx_rental_date (rental_date),
+                INDEX idx_status_due (rental_status, due_date),
                 CHECK (due_date >= DATE(rental_date))
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
         """
@@ -201,6 +206,194 @@ class DatabaseSetup:
             logger.error(f"❌ Table creation failed: {e}")
             return False
     
+    def add_missing_indexes(self):
+        """Add indexes introduced after a table was first created to existing databases."""
+        # (table, index name, column list)
+        indexes = [
+            ('rentals', 'idx_status_due', 'rental_status, due_date'),
+        ]
+        
+        try:
+            cursor = self.connection.cursor()
+            
+            for table_name, index_name, columns in indexes:
+                cursor.execute("""
+                    SELECT COUNT(*) FROM information_schema.STATISTICS
+                    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s
+                """, (table_name, index_name))
+                if cursor.fetchone()[0] > 0:
+                    continue
+                
+                cursor.execute(f"ALTER TABLE {table_name} ADD INDEX {index_name} ({columns})")
+                logger.info(f"✅ Index '{index_name}' added to '{table_name}'")
+            
+            cursor.close()
+            return True
+            
+        except Error as e:
+            logger.error(f"❌ Index migration failed: {e}")
+            return False
+    
+    def create_procedures(self):
+        """Create stored procedures that run rent/return as single server-side transactions."""
+        procedures = {}
+        version = f"v{PROCEDURES_VERSION}"
+        
+        procedures['rent_movie_sp'] = f"""
+            CREATE PROCEDURE rent_movie_sp(
+                IN p_customer_id INT,
+                IN p_movie_id INT,
+                IN p_employee_id INT,
+                IN p_due_date DATE,
+                OUT p_rental_id INT,
+                OUT p_title VARCHAR(255),
+                OUT p_total_charge DECIMAL(8,2)
+            )
+            COMMENT '{version}'
+            BEGIN
+                DECLARE v_is_active BOOLEAN;
+                DECLARE v_title VARCHAR(255);
+                DECLARE v_rate DECIMAL(5,2);
+                DECLARE v_stock INT;
+                DECLARE v_available BOOLEAN;
+                DECLARE v_days INT;
+                DECLARE EXIT HANDLER FOR SQLEXCEPTION
+                BEGIN
+                    ROLLBACK;
+                    RESIGNAL;
+                END;
+                
+                START TRANSACTION;
+                
+                SELECT is_active INTO v_is_active
+                FROM customers WHERE customer_id = p_customer_id;
+                IF v_is_active IS NULL THEN
+                    SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Customer not found';
+                END IF;
+                IF NOT v_is_active THEN
+                    SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Customer account is inactive';
+                END IF;
+                
+                -- Lock the movie row so concurrent rentals can't oversell its stock
+                SELECT title, rental_rate, stock_quantity, is_available
+                INTO v_title, v_rate, v_stock, v_available
+                FROM movies WHERE movie_id = p_movie_id
+                FOR UPDATE;
+                IF v_title IS NULL THEN
+                    SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Movie not found';
+                END IF;
+                IF NOT v_available OR v_stock <= 0 THEN
+                    SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Movie is not available for rental';
+                END IF;
+                
+                SET v_days = DATEDIFF(p_due_date, CURDATE());
+                IF v_days <= 0 THEN
+                    SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Due date must be in the future';
+                END IF;
+                
+                SET p_total_charge = v_rate * v_days;
+                
+                INSERT INTO rentals (customer_id, movie_id, employee_id, due_date, total_charge)
+                VALUES (p_customer_id, p_movie_id, p_employee_id, p_due_date, p_total_charge);
+                SET p_rental_id = LAST_INSERT_ID();
+                
+                UPDATE movies
+                SET stock_quantity = v_stock - 1,
+                    is_available = v_stock - 1 > 0
+                WHERE movie_id = p_movie_id;
+                
+                COMMIT;
+                SET p_title = v_title;
+            END
+        """
+        
+        procedures['return_movie_sp'] = f"""
+            CREATE PROCEDURE return_movie_sp(
+                IN p_rental_id INT,
+                IN p_employee_id INT,
+                IN p_late_fee_per_day DECIMAL(8,2),
+                OUT p_title VARCHAR(255),
+                OUT p_late_days INT,
+                OUT p_late_fee DECIMAL(8,2),
+                OUT p_total_charge DECIMAL(8,2),
+                OUT p_total_paid DECIMAL(8,2)
+            )
+            COMMENT '{version}'
+            BEGIN
+                DECLARE v_movie_id INT;
+                DECLARE v_due_date DATE;
+                DECLARE v_title VARCHAR(255);
+                DECLARE EXIT HANDLER FOR SQLEXCEPTION
+                BEGIN
+                    ROLLBACK;
+                    RESIGNAL;
+                END;
+                
+                START TRANSACTION;
+                
+                -- Lock the rental row so it can't be returned twice
+                SELECT r.movie_id, r.due_date, r.total_charge, m.title
+                INTO v_movie_id, v_due_date, p_total_charge, v_title
+                FROM rentals r
+                JOIN movies m ON r.movie_id = m.movie_id
+                WHERE r.rental_id = p_rental_id AND r.rental_status IN ('active', 'overdue')
+                FOR UPDATE;
+                IF v_title IS NULL THEN
+                    SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Rental not found or already returned';
+                END IF;
+                
+                SET p_late_days = GREATEST(DATEDIFF(CURDATE(), v_due_date), 0);
+                SET p_late_fee = p_late_days * p_late_fee_per_day;
+                SET p_total_paid = p_total_charge + p_late_fee;
+                
+                UPDATE rentals
+                SET actual_return_date = CURDATE(),
+                    late_fee = p_late_fee,
+                    rental_status = 'returned'
+                WHERE rental_id = p_rental_id;
+                
+                INSERT INTO returns (rental_id, return_date, late_days, late_fee, total_paid, processed_by)
+                VALUES (p_rental_id, NOW(), p_late_days, p_late_fee, p_total_paid, p_employee_id);
+                
+                UPDATE movies
+                SET stock_quantity = stock_quantity + 1,
+                    is_available = TRUE
+                WHERE movie_id = v_movie_id;
+                
+                COMMIT;
+                SET p_title = v_title;
+            END
+        """
+        
+        try:
+            cursor = self.connection.cursor()
+            
+            # Existing procedures and their versions; setup runs on every app launch,
+            # so current procedures are left alone instead of dropped under running clients
+            cursor.execute("""
+                SELECT ROUTINE_NAME, ROUTINE_COMMENT
+                FROM information_schema.ROUTINES
+                WHERE ROUTINE_SCHEMA = DATABASE() AND ROUTINE_TYPE = 'PROCEDURE'
+            """)
+            existing = dict(cursor.fetchall())
+            
+            for name, ddl in procedures.items():
+                if existing.get(name) == version:
+                    logger.info(f"ℹ️  Procedure '{name}' is up to date")
+                    continue
+                if name in existing:
+                    # Outdated definition from an older version
+                    cursor.execute(f"DROP PROCEDURE {name}")
+                cursor.execute(ddl)
+                logger.info(f"✅ Procedure '{name}' created successfully")
+            
+            cursor.close()
+            return True
+            
+        except Error as e:
+            logger.error(f"❌ Procedure creation failed: {e}")
+            return False
+    
     def create_default_admin(self):
         """Create default admin user with hashed password."""
         try:
@@ -304,11 +497,19 @@ class DatabaseSetup:
             if not self.create_tables():
                 return False
             
-            # Step 4: Create admin user
+            # Step 4: Add indexes missing from tables created by older versions
+            if not self.add_missing_indexes():
+                return False
+            
+            # Step 5: Create stored procedures
+            if not self.create_procedures():
+                return False
+            
+            # Step 6: Create admin user
             if not self.create_default_admin():
                 return False
             
-            # Step 5: Insert sample data (optional)
+            # Step 7: Insert sample data (optional)
             if len(sys.argv) > 1 and sys.argv[1] == '--with-sample-data':
                 self.insert_sample_data()
             
@@ -7,7 +7,6 @@ from tkinter import messagebox
 import logging
 from db.setup_database import DatabaseSetup
 from ui.views.login_view import LoginView
-from ui.views.dashboard import DashboardView
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +26,8 @@ class MovieRentalApp:
     def __init__(self):
         self.root = None
         self.current_user = None
+        self.login_view = None
+        self.dashboard_view = None
     
     def initialize_application(self):
         """Initialize the application and database."""
@@ -55,24 +56,27 @@ class MovieRentalApp:
         self.current_user = employee_data
         logger.info(f"User logged in: {employee_data['username']}")
         
-        # Close login window and open dashboard
-        self.root.destroy()
+        # Swap to the dashboard on the same root window
         self.show_dashboard(employee_data)
     
     def show_dashboard(self, employee_data):
         """Show the main dashboard."""
-        dashboard_root = tk.Tk()
-        dashboard_root.title("Movie Rental System - Dashboard")
-        dashboard_root.geometry("1000x700")
-        
-        from ui.views.dashboard import DashboardView
-        dashboard_view = DashboardView(dashboard_root, employee_data)
-        dashboard_view.pack(fill=tk.BOTH, expand=True)
-        
-        # Handle window close
-        dashboard_root.protocol("WM_DELETE_WINDOW", self.on_app_close)
-        
-        dashboard_root.mainloop()
+        if self.dashboard_view:
+            # Reuse the dashboard from a previous session, updating only its text
+            self.dashboard_view.set_employee(employee_data)
+        else:
+            # Imported on first login so the login screen doesn't wait on every view
+            from ui.views.dashboard import DashboardView
+            self.dashboard_view = DashboardView(self.root, employee_data, logout_callback=self.on_logout)
+        self.dashboard_view.pack(fill=tk.BOTH, expand=True)
+    
+    def on_logout(self):
+        """Return to the login screen after logout."""
+        self.current_user = None
+        # Destroy the open view so nothing bound to the previous employee outlives the session
+        self.dashboard_view.clear_content()
+        self.dashboard_view.pack_forget()
+        self.login_view.show()
     
     def on_app_close(self):
         """Handle application closure."""
@@ -92,8 +96,8 @@ class MovieRentalApp:
                 return
             
             # Show login screen
-            login_view = LoginView(self.root, login_callback=self.on_login_success)
-            login_view.pack(fill=tk.BOTH, expand=True)
+            self.login_view = LoginView(self.root, login_callback=self.on_login_success)
+            self.login_view.pack(fill=tk.BOTH, expand=True)
             
             # Handle window close
             self.root.protocol("WM_DELETE_WINDOW", self.on_app_close)
@@ -13,12 +13,16 @@ logger = logging.getLogger(__name__)
 class CustomerModel:
     """Handles all customer-related database operations."""
     
-    def __init__(self):
+    def __init__(self, pool=None):
         self.db_config = get_db_config()
+        # Optional shared connection pool; close() hands pooled connections back
+        self.pool = pool
     
     def _get_connection(self):
-        """Get database connection."""
+        """Get database connection, from the shared pool if set."""
         try:
+            if self.pool is not None:
+                return self.pool.get_connection()
             return mysql.connector.connect(**self.db_config)
         except Error as e:
             logger.error(f"Database connection failed: {e}")
@@ -220,13 +224,14 @@ class CustomerModel:
                 cursor.close()
             connection.close()
     
-    def search_customers(self, search_term=None, active_only=True):
+    def search_customers(self, search_term=None, active_only=True, limit=None):
         """
         Search customers by name or ID.
         
         Args:
             search_term (str): Search term for name or ID
             active_only (bool): Only show active customers
+            limit (int): Maximum number of customers to return (all if None)
             
         Returns:
             tuple: (success: bool, message: str, customers: list)
@@ -263,6 +268,10 @@ class CustomerModel:
                 ORDER BY last_name, first_name
             """
             
+            if limit is not None:
+                query += " LIMIT %s"
+                params.append(limit)
+            
             cursor.execute(query, params)
             customers = cursor.fetchall()
             
@@ -7,23 +7,70 @@ import mysql.connector
 from mysql.connector import Error
 from config import get_db_config
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Available-movie searches are cached briefly; other clients' changes show up after this
+AVAILABLE_CACHE_TTL = 30  # seconds
+AVAILABLE_CACHE_SIZE = 256
+
 class MovieModel:
     """Handles all movie-related database operations."""
     
-    def __init__(self):
+    def __init__(self, connection=None, pool=None):
         self.db_config = get_db_config()
+        # Optional long-lived connection reused by every call instead of connecting per call
+        self.connection = connection
+        # Optional shared connection pool; close() hands pooled connections back
+        self.pool = pool
+        # (title, limit) -> (fetched_at, result) for search_available_movies
+        self._available_cache = {}
     
     def _get_connection(self):
-        """Get database connection."""
+        """Get database connection, reusing the persistent one or the shared pool if set."""
         try:
+            if self.connection is not None:
+                if not self.connection.is_connected():
+                    self.connection.reconnect()
+                return self.connection
+            if self.pool is not None:
+                return self.pool.get_connection()
             return mysql.connector.connect(**self.db_config)
         except Error as e:
             logger.error(f"Database connection failed: {e}")
             return None
     
+    def _release_connection(self, connection):
+        """Close (or return to the pool) a per-call connection; the persistent one stays open."""
+        if connection is not self.connection:
+            connection.close()
+    
+    def open_persistent_connection(self):
+        """
+        Open a connection that is reused by all calls until close_persistent_connection().
+        
+        Autocommit is enabled so reads on the long-lived session are not pinned
+        to a stale transaction snapshot.
+        
+        Returns:
+            bool: True if the connection was opened
+        """
+        try:
+            self.connection = mysql.connector.connect(**self.db_config)
+            self.connection.autocommit = True
+            return True
+        except Error as e:
+            logger.error(f"Database connection failed: {e}")
+            self.connection = None
+            return False
+    
+    def close_persistent_connection(self):
+        """Close the persistent connection, if one is open."""
+        connection, self.connection = self.connection, None
+        if connection is not None and connection.is_connected():
+            connection.close()
+    
     def add_movie(self, title, director, genre, release_year, duration, description, 
                   rental_rate, total_copies):
         """
@@ -79,7 +126,7 @@ class MovieModel:
         finally:
             if cursor:
                 cursor.close()
-            connection.close()
+            self._release_connection(connection)
     
     def update_movie(self, movie_id, **kwargs):
         """
@@ -127,7 +174,7 @@ class MovieModel:
         finally:
             if cursor:
                 cursor.close()
-            connection.close()
+            self._release_connection(connection)
     
     def delete_movie(self, movie_id):
         """
@@ -175,7 +222,7 @@ class MovieModel:
         finally:
             if cursor:
                 cursor.close()
-            connection.close()
+            self._release_connection(connection)
     
     def get_movie_by_id(self, movie_id):
         """
@@ -209,10 +256,11 @@ class MovieModel:
         finally:
             if cursor:
                 cursor.close()
-            connection.close()
+            self._release_connection(connection)
     
     def search_movies(self, title=None, genre=None, director=None, release_year=None, 
-                     min_price=None, max_price=None, available_only=False):
+                     min_price=None, max_price=None, available_only=False,
+                     limit=None, offset=0):
         """
         Search movies with various filters.
         
@@ -224,6 +272,8 @@ class MovieModel:
             min_price (float): Minimum rental rate
             max_price (float): Maximum rental rate
             available_only (bool): Only show available movies
+            limit (int): Maximum number of movies to return (all if None)
+            offset (int): Number of movies to skip, for paging
             
         Returns:
             tuple: (success: bool, message: str, movies: list)
@@ -278,6 +328,10 @@ class MovieModel:
                 ORDER BY title
             """
             
+            if limit is not None:
+                query += " LIMIT %s OFFSET %s"
+                params.extend([limit, offset])
+            
             cursor.execute(query, params)
             movies = cursor.fetchall()
             
@@ -289,16 +343,47 @@ class MovieModel:
         finally:
             if cursor:
                 cursor.close()
-            connection.close()
+            self._release_connection(connection)
     
-    def get_all_movies(self):
+    def get_all_movies(self, limit=None, offset=0):
         """
         Get all movies.
         
+        Args:
+            limit (int): Maximum number of movies to return (all if None)
+            offset (int): Number of movies to skip, for paging
+        
+        Returns:
+            tuple: (success: bool, message: str, movies: list)
+        """
+        return self.search_movies(limit=limit, offset=offset)
+    
+    def search_available_movies(self, title, limit=None):
+        """
+        Search available movies by title, reusing results fetched in the last few seconds.
+        
+        Args:
+            title (str): Partial title match
+            limit (int): Maximum number of movies to return (all if None)
+            
         Returns:
             tuple: (success: bool, message: str, movies: list)
         """
-        return self.search_movies()
+        key = (title, limit)
+        cached = self._available_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < AVAILABLE_CACHE_TTL:
+            return cached[1]
+        
+        result = self.search_movies(title=title, available_only=True, limit=limit)
+        if result[0]:
+            if len(self._available_cache) >= AVAILABLE_CACHE_SIZE:
+                self._available_cache.clear()
+            self._available_cache[key] = (time.monotonic(), result)
+        return result
+    
+    def invalidate_available_cache(self):
+        """Forget cached available-movie searches, e.g. after a rental or return."""
+        self._available_cache.clear()
     
     def update_stock_quantity(self, movie_id, new_quantity):
         """
@@ -339,4 +424,4 @@ class MovieModel:
         finally:
             if cursor:
                 cursor.close()
-            connection.close()
\ No newline at end of file
+            self._release_connection(connection)
\ No newline at end of file
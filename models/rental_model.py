@@ -14,13 +14,30 @@ logger = logging.getLogger(__name__)
 class RentalModel:
     """Handles all rental-related database operations."""
     
-    def __init__(self):
+    # SQLSTATE the rent/return procedures SIGNAL for rule violations (message is user-facing)
+    _BUSINESS_RULE_SQLSTATE = '45000'
+    
+    # Display strings formatted by MySQL, so the GUI doesn't format each row in Python
+    _DISPLAY_COLUMNS = """
+                       CONCAT(c.first_name, ' ', c.last_name) as customer_name,
+                       DATE_FORMAT(r.rental_date, '%Y-%m-%d') as rental_date_s,
+                       DATE_FORMAT(r.due_date, '%Y-%m-%d') as due_date_s,
+                       COALESCE(DATE_FORMAT(r.actual_return_date, '%Y-%m-%d'), '') as return_date_s,
+                       CONCAT(UPPER(LEFT(r.rental_status, 1)), SUBSTRING(r.rental_status, 2)) as status_s,
+                       CONCAT('$', r.total_charge) as total_charge_s,
+                       CONCAT('$', r.late_fee) as late_fee_s"""
+    
+    def __init__(self, pool=None):
         self.db_config = get_db_config()
         self.late_fee_per_day = 2.00  # Default late fee per day
+        # Optional shared connection pool; close() hands pooled connections back
+        self.pool = pool
     
     def _get_connection(self):
-        """Get database connection."""
+        """Get database connection, from the shared pool if set."""
         try:
+            if self.pool is not None:
+                return self.pool.get_connection()
             connection = mysql.connector.connect(**self.db_config)
             return connection
         except Error as e:
@@ -48,75 +65,21 @@ class RentalModel:
         try:
             cursor = connection.cursor()
             
-            # Check if customer exists and is active
-            cursor.execute("SELECT is_active FROM customers WHERE customer_id = %s", (customer_id,))
-            customer_result = cursor.fetchone()
-            if not customer_result:
-                return False, "Customer not found", None
-            if not customer_result[0]:
-                return False, "Customer account is inactive", None
-            
-            # Check if movie exists and is available
-            cursor.execute("""
-                SELECT title, rental_rate, stock_quantity, is_available 
-                FROM movies WHERE movie_id = %s
-            """, (movie_id,))
-            movie_result = cursor.fetchone()
-            if not movie_result:
-                return False, "Movie not found", None
-            
-            title, rental_rate, stock_quantity, is_available = movie_result
-            
-            if not is_available or stock_quantity <= 0:
-                return False, "Movie is not available for rental", None
-            
-            # Calculate rental period and charge
-            rental_date = datetime.now().date()
-            rental_days = (due_date - rental_date).days
-            
-            if rental_days <= 0:
-                return False, "Due date must be in the future", None
-            
-            total_charge = rental_rate * rental_days
-            
-            # Start transaction explicitly
-            connection.autocommit = False
-            
-            # Insert rental record
-            cursor.execute("""
-                INSERT INTO rentals (customer_id, movie_id, employee_id, due_date, total_charge)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (customer_id, movie_id, employee_id, due_date, total_charge))
-            
-            rental_id = cursor.lastrowid
-            
-            # Update movie stock quantity
-            new_stock = stock_quantity - 1
-            is_available_new = new_stock > 0
-            
-            cursor.execute("""
-                UPDATE movies 
-                SET stock_quantity = %s,
-                    is_available = %s
-                WHERE movie_id = %s
-            """, (new_stock, is_available_new, movie_id))
-            
-            # Commit transaction
-            connection.commit()
+            # Checks, insert and stock update run server-side in one transaction
+            args = cursor.callproc('rent_movie_sp', (
+                customer_id, movie_id, employee_id, due_date, 0, '', 0
+            ))
+            rental_id, title, total_charge = args[4:]
             
             logger.info(f"Movie rented successfully: {title} to customer {customer_id} (Rental ID: {rental_id})")
             return True, f"Movie '{title}' rented successfully. Charge: ${total_charge:.2f}", rental_id
             
         except Error as e:
-            # Rollback transaction on error
-            if connection:
-                connection.rollback()
             logger.error(f"Rent movie failed: {e}")
+            if e.sqlstate == self._BUSINESS_RULE_SQLSTATE:
+                return False, e.msg, None
             return False, f"Failed to rent movie: {str(e)}", None
         finally:
-            # Reset autocommit and close connection
-            if connection:
-                connection.autocommit = True
             if cursor:
                 cursor.close()
             if connection:
@@ -139,88 +102,39 @@ class RentalModel:
         
         cursor = None
         try:
-            cursor = connection.cursor(dictionary=True)
-            
-            # Get rental details
-            cursor.execute("""
-                SELECT r.rental_id, r.customer_id, r.movie_id, r.due_date, r.total_charge,
-                       m.title, m.rental_rate, m.stock_quantity
-                FROM rentals r
-                JOIN movies m ON r.movie_id = m.movie_id
-                WHERE r.rental_id = %s AND r.rental_status = 'active'
-            """, (rental_id,))
-            
-            rental = cursor.fetchone()
-            
-            if not rental:
-                return False, "Rental not found or already returned", None
-            
-            # Calculate late fees
-            return_date = datetime.now().date()
-            due_date = rental['due_date']
-            late_days = max(0, (return_date - due_date).days)
-            late_fee = late_days * self.late_fee_per_day
-            total_paid = float(rental['total_charge']) + late_fee
-            
-            # Start transaction
-            connection.autocommit = False
-            
-            # Update rental record
-            cursor.execute("""
-                UPDATE rentals 
-                SET actual_return_date = %s, 
-                    late_fee = %s,
-                    rental_status = 'returned'
-                WHERE rental_id = %s
-            """, (return_date, late_fee, rental_id))
-            
-            # Insert return record
-            cursor.execute("""
-                INSERT INTO returns (rental_id, return_date, late_days, late_fee, total_paid, processed_by)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (rental_id, datetime.now(), late_days, late_fee, total_paid, employee_id))
+            cursor = connection.cursor()
             
-            # Update movie stock quantity
-            new_stock = rental['stock_quantity'] + 1
-            cursor.execute("""
-                UPDATE movies 
-                SET stock_quantity = %s,
-                    is_available = TRUE
-                WHERE movie_id = %s
-            """, (new_stock, rental['movie_id']))
-            
-            # Commit transaction
-            connection.commit()
+            # Late fee, rental update, return record and restock run server-side in one transaction
+            args = cursor.callproc('return_movie_sp', (
+                rental_id, employee_id, self.late_fee_per_day, '', 0, 0, 0, 0
+            ))
+            title, late_days, late_fee, total_charge, total_paid = args[3:]
             
             return_data = {
                 'rental_id': rental_id,
-                'movie_title': rental['title'],
-                'return_date': return_date,
+                'movie_title': title,
+                'return_date': datetime.now().date(),
                 'late_days': late_days,
                 'late_fee': late_fee,
-                'original_charge': rental['total_charge'],
+                'original_charge': total_charge,
                 'total_paid': total_paid
             }
             
-            logger.info(f"Movie returned successfully: {rental['title']} (Rental ID: {rental_id})")
+            logger.info(f"Movie returned successfully: {title} (Rental ID: {rental_id})")
             
             if late_days > 0:
-                message = f"Movie '{rental['title']}' returned {late_days} day(s) late. Late fee: ${late_fee:.2f}. Total: ${total_paid:.2f}"
+                message = f"Movie '{title}' returned {late_days} day(s) late. Late fee: ${late_fee:.2f}. Total: ${total_paid:.2f}"
             else:
-                message = f"Movie '{rental['title']}' returned on time. Total: ${total_paid:.2f}"
+                message = f"Movie '{title}' returned on time. Total: ${total_paid:.2f}"
             
             return True, message, return_data
             
         except Error as e:
-            # Rollback transaction on error
-            if connection:
-                connection.rollback()
             logger.error(f"Return movie failed: {e}")
+            if e.sqlstate == self._BUSINESS_RULE_SQLSTATE:
+                return False, e.msg, None
             return False, f"Failed to return movie: {str(e)}", None
         finally:
-            # Reset autocommit and close connection
-            if connection:
-                connection.autocommit = True
             if cursor:
                 cursor.close()
             if connection:
@@ -245,17 +159,57 @@ class RentalModel:
         
         return late_days, late_fee
     
+    def _build_rental_filters(self, customer_id=None, movie_id=None, status=None,
+                              start_date=None, end_date=None):
+        """
+        Build the WHERE clause shared by rental searches and counts.
+        
+        Returns:
+            tuple: (where_clause: str, params: list)
+        """
+        conditions = []
+        params = []
+        
+        if customer_id:
+            conditions.append("r.customer_id = %s")
+            params.append(customer_id)
+        
+        if movie_id:
+            conditions.append("r.movie_id = %s")
+            params.append(movie_id)
+        
+        if status == 'overdue':
+            # Unreturned past-due rentals, whether or not update_overdue_statuses has flagged them
+            conditions.append("r.rental_status IN ('active', 'overdue') AND r.due_date < CURDATE()")
+        elif status:
+            conditions.append("r.rental_status = %s")
+            params.append(status)
+        
+        if start_date:
+            conditions.append("r.rental_date >= %s")
+            params.append(start_date)
+        
+        if end_date:
+            conditions.append("r.rental_date <= %s")
+            params.append(end_date)
+        
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        return where_clause, params
+    
     def search_rentals(self, customer_id=None, movie_id=None, status=None, 
-                      start_date=None, end_date=None):
+                      start_date=None, end_date=None, limit=None, offset=0):
         """
         Search rentals with various filters.
         
         Args:
             customer_id (int): Filter by customer
             movie_id (int): Filter by movie
-            status (str): Filter by status (active/returned/overdue)
+            status (str): Filter by status (active/returned/overdue); overdue
+                matches every unreturned rental past its due date
             start_date (datetime.date): Start date for rental period
             end_date (datetime.date): End date for rental period
+            limit (int): Maximum number of rentals to return (all if None)
+            offset (int): Number of rentals to skip, for paging
             
         Returns:
             tuple: (success: bool, message: str, rentals: list)
@@ -268,31 +222,12 @@ class RentalModel:
         try:
             cursor = connection.cursor(dictionary=True)
             
-            # Build dynamic WHERE clause
-            conditions = []
-            params = []
-            
-            if customer_id:
-                conditions.append("r.customer_id = %s")
-                params.append(customer_id)
+            where_clause, params = self._build_rental_filters(
+                customer_id, movie_id, status, start_date, end_date
+            )
             
-            if movie_id:
-                conditions.append("r.movie_id = %s")
-                params.append(movie_id)
-            
-            if status:
-                conditions.append("r.rental_status = %s")
-                params.append(status)
-            
-            if start_date:
-                conditions.append("r.rental_date >= %s")
-                params.append(start_date)
-            
-            if end_date:
-                conditions.append("r.rental_date <= %s")
-                params.append(end_date)
-            
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
+            # Overdue rentals are listed most overdue first
+            order_by = "r.due_date ASC" if status == 'overdue' else "r.rental_date DESC"
             
             query = f"""
                 SELECT r.rental_id, r.customer_id, r.movie_id, r.employee_id,
@@ -301,15 +236,21 @@ class RentalModel:
                        c.first_name as customer_first_name, 
                        c.last_name as customer_last_name,
                        m.title as movie_title,
-                       CONCAT(e.first_name, ' ', e.last_name) as employee_name
+                       CONCAT(e.first_name, ' ', e.last_name) as employee_name,
+                       GREATEST(DATEDIFF(CURDATE(), r.due_date), 0) as days_overdue,
+                       {self._DISPLAY_COLUMNS}
                 FROM rentals r
                 JOIN customers c ON r.customer_id = c.customer_id
                 JOIN movies m ON r.movie_id = m.movie_id
                 JOIN employees e ON r.employee_id = e.employee_id
                 WHERE {where_clause}
-                ORDER BY r.rental_date DESC
+                ORDER BY {order_by}
             """
             
+            if limit is not None:
+                query += " LIMIT %s OFFSET %s"
+                params.extend([limit, offset])
+            
             cursor.execute(query, params)
             rentals = cursor.fetchall()
             
@@ -324,60 +265,197 @@ class RentalModel:
             if connection:
                 connection.close()
     
-    def get_active_rentals(self):
+    def count_rentals(self, customer_id=None, movie_id=None, status=None,
+                      start_date=None, end_date=None):
         """
-        Get all active rentals (not returned).
+        Count rentals matching the same filters as search_rentals.
         
         Returns:
-            tuple: (success: bool, message: str, rentals: list)
+            tuple: (success: bool, message: str, count: int)
         """
-        return self.search_rentals(status='active')
+        connection = self._get_connection()
+        if not connection:
+            return False, "Database connection failed", 0
+        
+        cursor = None
+        try:
+            cursor = connection.cursor()
+            
+            where_clause, params = self._build_rental_filters(
+                customer_id, movie_id, status, start_date, end_date
+            )
+            
+            cursor.execute(f"SELECT COUNT(*) FROM rentals r WHERE {where_clause}", params)
+            count = cursor.fetchone()[0]
+            
+            return True, f"Found {count} rentals", count
+            
+        except Error as e:
+            logger.error(f"Count rentals failed: {e}")
+            return False, f"Count failed: {str(e)}", 0
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
     
-    def get_overdue_rentals(self):
+    def get_monthly_rental_totals(self):
         """
-        Get all overdue rentals.
+        Aggregate rentals per calendar month in the database.
         
         Returns:
-            tuple: (success: bool, message: str, rentals: list)
+            tuple: (success: bool, message: str, rows: list of dicts with
+                    month ('YYYY-MM'), rental_count and revenue, oldest first)
         """
         connection = self._get_connection()
         if not connection:
-            return False, "Database connection failed", None
+            return False, "Database connection failed", []
         
         cursor = None
         try:
             cursor = connection.cursor(dictionary=True)
+            cursor.execute("""
+                SELECT DATE_FORMAT(rental_date, '%Y-%m') as month,
+                       COUNT(*) as rental_count,
+                       COALESCE(SUM(total_charge), 0) as revenue
+                FROM rentals
+                GROUP BY DATE_FORMAT(rental_date, '%Y-%m')
+                ORDER BY month
+            """)
+            rows = cursor.fetchall()
+            
+            return True, f"Found {len(rows)} months", rows
             
+        except Error as e:
+            logger.error(f"Get monthly rental totals failed: {e}")
+            return False, f"Aggregation failed: {str(e)}", []
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+    
+    def get_genre_rental_totals(self):
+        """
+        Aggregate rentals per movie genre in the database.
+        
+        Returns:
+            tuple: (success: bool, message: str, rows: list of dicts with
+                    genre ('Unknown' when unset), rental_count and revenue,
+                    most rented first)
+        """
+        connection = self._get_connection()
+        if not connection:
+            return False, "Database connection failed", []
+        
+        cursor = None
+        try:
+            cursor = connection.cursor(dictionary=True)
             cursor.execute("""
-                SELECT r.rental_id, r.customer_id, r.movie_id, r.employee_id,
-                       r.rental_date, r.due_date, r.total_charge, r.late_fee,
-                       c.first_name as customer_first_name, 
-                       c.last_name as customer_last_name,
-                       m.title as movie_title,
-                       CONCAT(e.first_name, ' ', e.last_name) as employee_name,
-                       DATEDIFF(CURDATE(), r.due_date) as days_overdue
+                SELECT COALESCE(m.genre, 'Unknown') as genre,
+                       COUNT(*) as rental_count,
+                       COALESCE(SUM(r.total_charge), 0) as revenue
                 FROM rentals r
-                JOIN customers c ON r.customer_id = c.customer_id
-                JOIN movies m ON r.movie_id = m.movie_id
-                JOIN employees e ON r.employee_id = e.employee_id
-                WHERE r.rental_status = 'active' 
-                AND r.due_date < CURDATE()
-                ORDER BY r.due_date ASC
+                LEFT JOIN movies m ON r.movie_id = m.movie_id
+                GROUP BY COALESCE(m.genre, 'Unknown')
+                ORDER BY rental_count DESC
             """)
+            rows = cursor.fetchall()
             
-            rentals = cursor.fetchall()
+            return True, f"Found {len(rows)} genres", rows
             
-            return True, f"Found {len(rentals)} overdue rentals", rentals
+        except Error as e:
+            logger.error(f"Get genre rental totals failed: {e}")
+            return False, f"Aggregation failed: {str(e)}", []
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+    
+    def get_rental_status_totals(self):
+        """
+        Aggregate rentals per status in the database.
+        
+        Returns:
+            tuple: (success: bool, message: str, rows: list of dicts with
+                    rental_status, rental_count and revenue)
+        """
+        connection = self._get_connection()
+        if not connection:
+            return False, "Database connection failed", []
+        
+        cursor = None
+        try:
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute("""
+                SELECT rental_status,
+                       COUNT(*) as rental_count,
+                       COALESCE(SUM(total_charge), 0) as revenue
+                FROM rentals
+                GROUP BY rental_status
+            """)
+            rows = cursor.fetchall()
+            
+            return True, f"Found {len(rows)} statuses", rows
+            
+        except Error as e:
+            logger.error(f"Get rental status totals failed: {e}")
+            return False, f"Aggregation failed: {str(e)}", []
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+    
+    def get_rental_charge_counts(self):
+        """
+        Count rentals per distinct total charge in the database.
+        
+        Returns:
+            tuple: (success: bool, message: str, rows: list of dicts with
+                    total_charge (0 when unset) and rental_count, lowest charge first)
+        """
+        connection = self._get_connection()
+        if not connection:
+            return False, "Database connection failed", []
+        
+        cursor = None
+        try:
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute("""
+                SELECT COALESCE(total_charge, 0) as total_charge,
+                       COUNT(*) as rental_count
+                FROM rentals
+                GROUP BY COALESCE(total_charge, 0)
+                ORDER BY total_charge
+            """)
+            rows = cursor.fetchall()
+            
+            return True, f"Found {len(rows)} charges", rows
             
         except Error as e:
-            logger.error(f"Get overdue rentals failed: {e}")
-            return False, f"Operation failed: {str(e)}", None
+            logger.error(f"Get rental charge counts failed: {e}")
+            return False, f"Aggregation failed: {str(e)}", []
         finally:
             if cursor:
                 cursor.close()
             if connection:
                 connection.close()
     
+    def get_active_rentals(self, limit=None, offset=0):
+        """
+        Get all active rentals (not returned).
+        
+        Args:
+            limit (int): Maximum number of rentals to return (all if None)
+            offset (int): Number of rentals to skip, for paging
+            
+        Returns:
+            tuple: (success: bool, message: str, rentals: list)
+        """
+        return self.search_rentals(status='active', limit=limit, offset=offset)
+    
     def update_overdue_statuses(self):
         """
         Update rental statuses from 'active' to 'overdue' for past due rentals.
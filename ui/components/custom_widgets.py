@@ -0,0 +1,135 @@
+"""
+Custom Tk widgets shared by the views
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+DEFAULT_ROW_HEIGHT = 20
+WHEEL_SCROLL_ROWS = 3
+
+class VirtualTable:
+    """Keeps a full row list and renders only the visible window of it into a Treeview."""
+    
+    def __init__(self, tree, scrollbar, format_row, on_scroll=None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.format_row = format_row  # row dict -> (iid, values, tags)
+        self.on_scroll = on_scroll    # (start, stop) of the new window, e.g. to load more rows
+        self.rows = []
+        self._rendered = {}  # item ID -> (values, tags) currently in the tree
+        self._window_start = 0
+        self._visible_rows = int(tree.cget('height'))
+        self._render_after_id = None
+        
+        # The scrollbar drives the window over all rows, not the tree itself
+        scrollbar.configure(command=self._on_scrollbar)
+        tree.bind('<Configure>', self._on_configure)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            tree.bind(sequence, self._on_mousewheel)
+    
+    def set_rows(self, rows):
+        """Replace all rows and show the top of the list."""
+        self.rows = list(rows)
+        self._window_start = 0
+        self._schedule_render()
+    
+    def refresh(self):
+        """Re-render the visible window after rows were added or changed in place."""
+        self._schedule_render()
+    
+    @property
+    def window_start(self):
+        """Index of the first row of the visible window."""
+        return self._window_start
+    
+    def _on_configure(self, event):
+        """Recompute how many rows fit in the table after a resize."""
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or DEFAULT_ROW_HEIGHT)
+        visible_rows = max(1, event.height // row_height - 1)  # less the heading row
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self.scroll_to(self._window_start)
+    
+    def _on_scrollbar(self, action, amount, unit=None):
+        """Handle scrollbar drags and arrow/page clicks."""
+        if action == tk.MOVETO:
+            start = int(float(amount) * len(self.rows))
+        else:
+            step = self._visible_rows if unit == tk.PAGES else 1
+            start = self._window_start + int(amount) * step
+        self.scroll_to(start)
+    
+    def _on_mousewheel(self, event):
+        """Scroll the visible window with the mouse wheel."""
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self._window_start - WHEEL_SCROLL_ROWS)
+        else:
+            self.scroll_to(self._window_start + WHEEL_SCROLL_ROWS)
+        return 'break'
+    
+    def scroll_to(self, start):
+        """Move the visible window so it begins at row start."""
+        self._window_start = max(0, min(start, len(self.rows) - self._visible_rows))
+        if self.on_scroll is not None:
+            self.on_scroll(self._window_start, self._window_start + self._visible_rows)
+        self._schedule_render()
+    
+    def _schedule_render(self):
+        """Coalesce render requests into one idle-time render."""
+        if self._render_after_id is None:
+            self._render_after_id = self.tree.after_idle(self._render)
+    
+    def cancel(self):
+        """Cancel a pending render, e.g. before the tree is destroyed."""
+        if self._render_after_id is not None:
+            self.tree.after_cancel(self._render_after_id)
+            self._render_after_id = None
+    
+    def _render(self):
+        """Render only the rows of the visible window into the tree."""
+        self._render_after_id = None
+        
+        tree = self.tree
+        if not tree.winfo_exists():
+            return
+        
+        total = len(self.rows)
+        start = self._window_start
+        stop = min(start + self._visible_rows, total)
+        rows = [self.format_row(row) for row in self.rows[start:stop]]
+        
+        # Diff against the rendered rows so unchanged rows (and their selection) stay put
+        rendered = self._rendered
+        wanted = {str(iid): (values, tags) for iid, values, tags in rows}
+        stale = [iid for iid in rendered if iid not in wanted]
+        changed = [(iid, row) for iid, row in wanted.items() if rendered.get(iid) != row]
+        order = tuple(wanted)
+        
+        if stale or changed or tree.get_children() != order:
+            # Hide the columns while mutating so Tk lays the table out once
+            display_columns = tree['displaycolumns']
+            tree.configure(displaycolumns=())
+            try:
+                if stale:
+                    tree.delete(*stale)
+                    for iid in stale:
+                        del rendered[iid]
+                
+                for iid, row in changed:
+                    values, tags = row
+                    if iid in rendered:
+                        tree.item(iid, values=values, tags=tags)
+                    else:
+                        tree.insert('', tk.END, iid=iid, values=values, tags=tags)
+                    rendered[iid] = row
+                
+                # Reorder in one call in case inserts or a new window changed the order
+                tree.set_children('', *order)
+            finally:
+                tree.configure(displaycolumns=display_columns)
+        
+        if total:
+            self.scrollbar.set(start / total, stop / total)
+        else:
+            self.scrollbar.set(0, 1)
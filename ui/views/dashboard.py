@@ -5,6 +5,7 @@ Main Dashboard with Toggle Navigation
 import tkinter as tk
 from tkinter import ttk
 import logging
+from enum import IntEnum
 from .movie_management import MovieManagementView
 from .customer_management import CustomerManagementView
 from .rental_management import RentalManagementView
@@ -14,18 +15,34 @@ from ui.styles.theme import ModernTheme
 
 logger = logging.getLogger(__name__)
 
+class Nav(IntEnum):
+    """Sidebar navigation entries, in display order."""
+    MOVIES = 0
+    CUSTOMERS = 1
+    RENTALS = 2
+    REPORTS = 3
+
 class DashboardView(ttk.Frame):
     """Main dashboard view with navigation toggle buttons."""
     
-    def __init__(self, parent, employee_data):
+    _theme = None
+    _style = None
+    _colors = None
+    
+    def __init__(self, parent, employee_data, logout_callback=None):
         super().__init__(parent)
         self.parent = parent
         self.employee_data = employee_data
+        self.logout_callback = logout_callback
         self.current_view = None
+        self._active_key = None
         
-        # Apply modern theme
-        self.theme = ModernTheme()
-        self.style, self.colors = self.theme.configure_styles()
+        # Apply modern theme (ttk styles are interpreter-global, so configure once)
+        if DashboardView._theme is None:
+            DashboardView._theme = ModernTheme()
+            DashboardView._style, DashboardView._colors = DashboardView._theme.configure_styles()
+        self.theme = DashboardView._theme
+        self.style, self.colors = DashboardView._style, DashboardView._colors
         
         self.setup_window()
         self.create_widgets()
@@ -37,6 +54,7 @@ class DashboardView(ttk.Frame):
         """Configure the main window."""
         self.parent.title("Movie Rental System - Dashboard")
         self.parent.geometry("1200x800")
+        self.parent.resizable(True, True)
         self.parent.minsize(1000, 600)
     
     def create_widgets(self):
@@ -53,16 +71,23 @@ class DashboardView(ttk.Frame):
     
     def create_header(self, parent):
         """Create header with user info and logout."""
+        emp = self.employee_data
+        first, last, role = emp['first_name'], emp['last_name'], emp['role']
+        
         header_frame = ttk.Frame(parent, style='Header.TFrame')
         header_frame.pack(fill=tk.X, padx=20, pady=10)
         
+        # Header text is bound to variables so a re-login only updates text
+        self.welcome_var = tk.StringVar(value=f"Welcome, {first} {last}!")
+        self.role_var = tk.StringVar(value=f"Role: {role.title()}")
+        
         # Welcome message
         welcome_frame = ttk.Frame(header_frame, style='Header.TFrame')
         welcome_frame.pack(side=tk.LEFT)
         
         welcome_label = ttk.Label(
             welcome_frame,
-            text=f"Welcome, {self.employee_data['first_name']} {self.employee_data['last_name']}!",
+            textvariable=self.welcome_var,
             font=('Arial', 16, 'bold'),
             style='Header.TLabel'
         )
@@ -70,7 +95,7 @@ class DashboardView(ttk.Frame):
         
         role_label = ttk.Label(
             welcome_frame,
-            text=f"Role: {self.employee_data['role'].title()}",
+            textvariable=self.role_var,
             font=('Arial', 12),
             style='Header.TLabel'
         )
@@ -85,6 +110,18 @@ class DashboardView(ttk.Frame):
         )
         logout_btn.pack(side=tk.RIGHT)
     
+    def set_employee(self, employee_data):
+        """Reuse this dashboard for a newly logged-in employee."""
+        self.employee_data = employee_data
+        emp = employee_data
+        self.welcome_var.set(f"Welcome, {emp['first_name']} {emp['last_name']}!")
+        self.role_var.set(f"Role: {emp['role'].title()}")
+        
+        self.setup_window()
+        
+        # Views such as rental management capture the employee, so rebuild the default one
+        self.show_movie_management()
+    
     def create_content_area(self, parent):
         """Create navigation and content area."""
         content_frame = ttk.Frame(parent)
@@ -111,7 +148,7 @@ class DashboardView(ttk.Frame):
         )
         nav_title.pack(pady=(0, 20))
         
-        # Navigation buttons
+        # Navigation buttons, in Nav order
         nav_buttons = [
             ("🎬 Movie Management", self.show_movie_management),
             ("👥 Customer Management", self.show_customer_management),
@@ -119,7 +156,7 @@ class DashboardView(ttk.Frame):
             ("📊 Reports", self.show_reports),
         ]
         
-        self.nav_buttons = {}
+        self.nav_buttons = []
         for text, command in nav_buttons:
             btn = ttk.Button(
                 sidebar_frame,
@@ -129,23 +166,25 @@ class DashboardView(ttk.Frame):
                 width=20
             )
             btn.pack(fill=tk.X, pady=5)
-            self.nav_buttons[text] = btn
+            self.nav_buttons.append(btn)
         
         # Set initial active button
-        self.set_active_nav("🎬 Movie Management")
+        self.set_active_nav(Nav.MOVIES)
     
     def create_main_content(self, parent):
         """Create main content area where views will be displayed."""
         self.content_frame = ttk.Frame(parent, style='Content.TFrame')
         self.content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     
-    def set_active_nav(self, active_text):
-        """Set active navigation button style."""
-        for text, button in self.nav_buttons.items():
-            if text == active_text:
-                button.configure(style='ActiveNav.TButton')
-            else:
-                button.configure(style='Nav.TButton')
+    def set_active_nav(self, nav):
+        """Set active navigation button style, restyling only the buttons that change."""
+        if nav == self._active_key:
+            return
+        
+        if self._active_key is not None:
+            self.nav_buttons[self._active_key].configure(style='Nav.TButton')
+        self.nav_buttons[nav].configure(style='ActiveNav.TButton')
+        self._active_key = nav
     
     def clear_content(self):
         """Clear the current content view."""
@@ -156,7 +195,7 @@ class DashboardView(ttk.Frame):
     def show_movie_management(self):
         """Show movie management view."""
         self.clear_content()
-        self.set_active_nav("🎬 Movie Management")
+        self.set_active_nav(Nav.MOVIES)
         
         self.current_view = MovieManagementView(self.content_frame)
         self.current_view.pack(fill=tk.BOTH, expand=True)
@@ -165,7 +204,7 @@ class DashboardView(ttk.Frame):
     def show_customer_management(self):
         """Show customer management view."""
         self.clear_content()
-        self.set_active_nav("👥 Customer Management")
+        self.set_active_nav(Nav.CUSTOMERS)
         
         self.current_view = CustomerManagementView(self.content_frame)
         self.current_view.pack(fill=tk.BOTH, expand=True)
@@ -174,7 +213,7 @@ class DashboardView(ttk.Frame):
     def show_rental_management(self):
         """Show rental management view."""
         self.clear_content()
-        self.set_active_nav("📦 Rental Management")
+        self.set_active_nav(Nav.RENTALS)
         
         self.current_view = RentalManagementView(self.content_frame, self.employee_data)
         self.current_view.pack(fill=tk.BOTH, expand=True)
@@ -183,7 +222,7 @@ class DashboardView(ttk.Frame):
     def show_reports(self):
         """Show reports view."""
         self.clear_content()
-        self.set_active_nav("📊 Reports")
+        self.set_active_nav(Nav.REPORTS)
         
         self.current_view = ReportsView(self.content_frame)
         self.current_view.pack(fill=tk.BOTH, expand=True)
@@ -192,9 +231,13 @@ class DashboardView(ttk.Frame):
     def logout(self):
         """Handle logout."""
         from tkinter import messagebox
+        username = self.employee_data['username']
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
-            logger.info(f"User logged out: {self.employee_data['username']}")
-            self.parent.destroy()
+            logger.info(f"User logged out: {username}")
+            if self.logout_callback:
+                self.logout_callback()
+            else:
+                self.parent.destroy()
     
     def apply_styling(self):
         """Apply modern styling to dashboard."""
@@ -4,12 +4,23 @@ Clean, professional login interface with secure authentication.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
+import tkinter.font as tkfont
 import logging
 from models.employee_model import EmployeeModel
 
 logger = logging.getLogger(__name__)
 
+# Font specs for the login screen, resolved to Font objects once per view
+FONT_SPECS = {
+    'title': ('Arial', 20, 'bold'),
+    'subtitle': ('Arial', 12),
+    'label': ('Arial', 10, 'bold'),
+    'entry': ('Arial', 11),
+    'small': ('Arial', 9),
+    'footer': ('Arial', 8),
+}
+
 class LoginView(ttk.Frame):
     """Login window for employee authentication."""
     
@@ -25,17 +36,23 @@ class LoginView(ttk.Frame):
         self.parent = parent
         self.login_callback = login_callback
         self.employee_model = EmployeeModel()
+        self.fonts = {}
         
         self.setup_window()
         self.create_widgets()
         self.apply_styling()
         
-        # Bind Enter key to login
-        self.parent.bind('<Return>', lambda event: self.handle_login())
+        # Bind Enter key to login on the form fields (not the root) so
+        # handlers don't accumulate when the view is created again
+        for entry in (self.username_entry, self.password_entry):
+            entry.bind('<Return>', self._on_return)
     
     def setup_window(self):
         """Configure the main window."""
         self.parent.title("Movie Rental System - Login")
+        # The root is shared with the dashboard; drop its minimum size so
+        # the window can shrink back to the login size after a logout
+        self.parent.minsize(1, 1)
         self.parent.geometry("400x500")
         self.parent.resizable(False, False)
         
@@ -69,21 +86,11 @@ class LoginView(ttk.Frame):
         header_frame.pack(pady=(0, 30))
         
         # Application title
-        title_label = ttk.Label(
-            header_frame,
-            text="Movie Rental System",
-            font=('Arial', 20, 'bold'),
-            foreground='#2c3e50'
-        )
+        title_label = self.create_label(header_frame, "Movie Rental System", 'title', '#2c3e50')
         title_label.pack(pady=(0, 10))
         
         # Subtitle
-        subtitle_label = ttk.Label(
-            header_frame,
-            text="Employee Login",
-            font=('Arial', 12),
-            foreground='#7f8c8d'
-        )
+        subtitle_label = self.create_label(header_frame, "Employee Login", 'subtitle', '#7f8c8d')
         subtitle_label.pack()
         
         # Separator
@@ -96,47 +103,31 @@ class LoginView(ttk.Frame):
         form_frame.pack(fill=tk.BOTH, expand=True)
         
         # Username field
-        username_label = ttk.Label(
-            form_frame,
-            text="Username:",
-            font=('Arial', 10, 'bold'),
-            foreground='#2c3e50'
-        )
+        username_label = self.create_label(form_frame, "Username:", 'label', '#2c3e50')
         username_label.pack(anchor=tk.W, pady=(0, 5))
         
         self.username_entry = ttk.Entry(
             form_frame,
-            font=('Arial', 11),
+            font=self.get_font('entry'),
             width=25
         )
         self.username_entry.pack(fill=tk.X, pady=(0, 15))
         self.username_entry.focus()  # Focus on username field by default
         
         # Password field
-        password_label = ttk.Label(
-            form_frame,
-            text="Password:",
-            font=('Arial', 10, 'bold'),
-            foreground='#2c3e50'
-        )
+        password_label = self.create_label(form_frame, "Password:", 'label', '#2c3e50')
         password_label.pack(anchor=tk.W, pady=(0, 5))
         
         self.password_entry = ttk.Entry(
             form_frame,
-            font=('Arial', 11),
+            font=self.get_font('entry'),
             width=25,
             show="•"  # Show bullets for password
         )
         self.password_entry.pack(fill=tk.X, pady=(0, 20))
         
         # Error message label
-        self.error_label = ttk.Label(
-            form_frame,
-            text="",
-            font=('Arial', 9),
-            foreground='#e74c3c',
-            wraplength=300
-        )
+        self.error_label = self.create_label(form_frame, "", 'small', '#e74c3c', wraplength=300)
         self.error_label.pack(pady=(0, 20))
         
         # Login button
@@ -149,11 +140,8 @@ class LoginView(ttk.Frame):
         self.login_button.pack(fill=tk.X, pady=(0, 15))
         
         # Forgot password label (placeholder)
-        forgot_label = ttk.Label(
-            form_frame,
-            text="Forgot password? Contact administrator.",
-            font=('Arial', 9),
-            foreground='#95a5a6',
+        forgot_label = self.create_label(
+            form_frame, "Forgot password? Contact administrator.", 'small', '#95a5a6',
             cursor="hand2"
         )
         forgot_label.pack()
@@ -165,23 +153,33 @@ class LoginView(ttk.Frame):
         footer_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(20, 0))
         
         # Version info
-        version_label = ttk.Label(
-            footer_frame,
-            text="Version 1.0.0",
-            font=('Arial', 8),
-            foreground='#bdc3c7'
-        )
+        version_label = self.create_label(footer_frame, "Version 1.0.0", 'footer', '#bdc3c7')
         version_label.pack()
         
         # Copyright
-        copyright_label = ttk.Label(
-            footer_frame,
-            text="© 2025 Movie Rental System",
-            font=('Arial', 8),
-            foreground='#bdc3c7'
-        )
+        copyright_label = self.create_label(footer_frame, "© 2025 Movie Rental System", 'footer', '#bdc3c7')
         copyright_label.pack()
     
+    def get_font(self, key):
+        """Return the cached Font object for a FONT_SPECS key."""
+        font = self.fonts.get(key)
+        if font is None:
+            family, size, *weight = FONT_SPECS[key]
+            font = tkfont.Font(self, family=family, size=size,
+                               weight=weight[0] if weight else 'normal')
+            self.fonts[key] = font
+        return font
+    
+    def create_label(self, parent, text, font_key, foreground, **options):
+        """Create a label using a cached font."""
+        return ttk.Label(
+            parent,
+            text=text,
+            font=self.get_font(font_key),
+            foreground=foreground,
+            **options
+        )
+    
     def apply_styling(self):
         """Apply modern styling to widgets."""
         style = ttk.Style()
@@ -212,6 +210,10 @@ class LoginView(ttk.Frame):
         # Configure the main frame background
         self.configure(style='TFrame')
     
+    def _on_return(self, event):
+        """Submit the login form when Enter is pressed."""
+        self.handle_login()
+    
     def handle_login(self):
         """Handle login button click."""
         username = self.username_entry.get().strip()
@@ -273,14 +275,9 @@ class LoginView(ttk.Frame):
         # Clear password field for security
         self.password_entry.delete(0, tk.END)
         
-        # Show success message
-        messagebox.showinfo(
-            "Login Successful",
-            f"Welcome back, {employee_data['first_name']} {employee_data['last_name']}!"
-        )
-        
-        # Call login callback if provided
+        # Call login callback if provided, keeping this view for the next login
         if self.login_callback:
+            self.pack_forget()
             self.login_callback(employee_data)
         else:
             # Default behavior: close login window
@@ -295,6 +292,12 @@ class LoginView(ttk.Frame):
         self.password_entry.delete(0, tk.END)
         self.password_entry.focus()
     
+    def show(self):
+        """Re-display the login view on its window after a logout."""
+        self.setup_window()
+        self.clear_form()
+        self.pack(fill=tk.BOTH, expand=True)
+    
     def clear_form(self):
         """Clear all form fields."""
         self.username_entry.delete(0, tk.END)
@@ -5,35 +5,103 @@ Movie Management GUI
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+import re
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from models.movie_model import MovieModel
+from ui.components.custom_widgets import VirtualTable
 
 logger = logging.getLogger(__name__)
 
+SEARCH_CACHE_SIZE = 128
+SEARCH_DEBOUNCE_MS = 250
+
+# Fixed movie table column widths; columns not listed use the default
+COL_WIDTHS = {'Title': 150, 'Director': 120, 'Genre': 80}
+DEFAULT_COL_WIDTH = 80
+
+# Numeric field validators, checked before conversion to avoid exception-driven parsing
+_INT_RE = re.compile(r'^-?\d+$')
+_FLOAT_RE = re.compile(r'^-?(\d+(\.\d*)?|\.\d+)$')
+
+# ttk styles are global to the Tk interpreter, so they only need registering once
+_STYLES_REGISTERED = False
+
 class MovieManagementView(ttk.Frame):
     """Movie management interface with CRUD operations."""
     
+    # Action buttons: (text, method name, style)
+    _BUTTON_SPEC = (
+        ("Add Movie", 'add_movie', '#27ae60.TButton'),
+        ("Update Movie", 'update_movie', '#3498db.TButton'),
+        ("Delete Movie", 'delete_movie', '#e74c3c.TButton'),
+        ("Clear Form", 'clear_form', '#95a5a6.TButton'),
+    )
+    
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
         self.movie_model = MovieModel()
         self.selected_movie_id = None
         
+        # Reuse one connection for all of this view's queries; closed in destroy()
+        self.movie_model.open_persistent_connection()
+        
+        # Paging state for lazy, scroll-driven loading
+        self._page_size = 100
+        self._offset = 0
+        self._exhausted = False
+        self._current_query = {}
+        
+        # Loaded movies by ID; the rows themselves live in the virtualized table
+        self.movies_table = None
+        self._movies_by_id = {}
+        
+        # LRU cache of first search pages keyed by normalized search term
+        self._search_cache = OrderedDict()
+        self._search_after_id = None
+        
+        # Model calls run on a worker thread; results are applied on the Tk thread.
+        # A single worker keeps the shared connection to one query at a time.
+        # The generation counter discards results of superseded loads/searches.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._generation = 0
+        self._loading = False
+        self._prefetched_next = None
+        
         self.create_widgets()
         self.apply_styling()
         self.load_movies()
     
+    def destroy(self):
+        """Cancel pending callbacks before destroying the view."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        if self.movies_table is not None:
+            self.movies_table.cancel()
+        # Close the connection after any queued queries, without blocking the UI
+        self._executor.submit(self.movie_model.close_persistent_connection)
+        self._executor.shutdown(wait=False)
+        super().destroy()
+    
     def create_widgets(self):
         """Create movie management widgets."""
+        # Build everything inside an unmapped container, then map it once
+        container = ttk.Frame(self)
+        
         # Title
         title_label = ttk.Label(
-            self,
+            container,
             text="Movie Management",
             font=('Arial', 18, 'bold')
         )
         title_label.pack(pady=(0, 20))
         
         # Form frame
-        form_frame = ttk.LabelFrame(self, text="Movie Details", padding=15)
+        form_frame = ttk.LabelFrame(container, text="Movie Details", padding=15)
         form_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
         
         self.create_form(form_frame)
@@ -42,16 +110,18 @@ class MovieManagementView(ttk.Frame):
         self.create_buttons(form_frame)
         
         # Search frame
-        search_frame = ttk.LabelFrame(self, text="Search Movies", padding=15)
+        search_frame = ttk.LabelFrame(container, text="Search Movies", padding=15)
         search_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
         
         self.create_search_form(search_frame)
         
         # Results frame
-        results_frame = ttk.LabelFrame(self, text="Movies", padding=10)
+        results_frame = ttk.LabelFrame(container, text="Movies", padding=10)
         results_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 10))
         
         self.create_results_table(results_frame)
+        
+        container.pack(fill=tk.BOTH, expand=True)
     
     def create_form(self, parent):
         """Create movie form fields."""
@@ -95,25 +165,22 @@ class MovieManagementView(ttk.Frame):
         ttk.Label(parent, text="Description").grid(row=4, column=0, sticky=tk.W, pady=5)
         self.desc_text = tk.Text(parent, width=80, height=4)
         self.desc_text.grid(row=4, column=1, columnspan=3, sticky=tk.W+tk.E, pady=5, padx=(0, 10))
+        
+        # Row 7: inline validation status below the buttons, instead of modal dialogs
+        self._status = ttk.Label(parent, text="", foreground='red')
+        self._status.grid(row=6, column=0, columnspan=4, sticky=tk.W)
     
     def create_buttons(self, parent):
         """Create action buttons."""
         button_frame = ttk.Frame(parent)
         button_frame.grid(row=5, column=0, columnspan=4, pady=15)
         
-        buttons = [
-            ("Add Movie", self.add_movie, '#27ae60'),
-            ("Update Movie", self.update_movie, '#3498db'),
-            ("Delete Movie", self.delete_movie, '#e74c3c'),
-            ("Clear Form", self.clear_form, '#95a5a6'),
-        ]
-        
-        for text, command, color in buttons:
+        for text, method_name, style in self._BUTTON_SPEC:
             btn = ttk.Button(
                 button_frame,
                 text=text,
-                command=command,
-                style=f'{color}.TButton'
+                command=getattr(self, method_name),
+                style=style
             )
             btn.pack(side=tk.LEFT, padx=5)
     
@@ -126,7 +193,7 @@ class MovieManagementView(ttk.Frame):
         
         self.search_entry = ttk.Entry(search_frame, width=30)
         self.search_entry.pack(side=tk.LEFT, padx=(0, 10))
-        self.search_entry.bind('<KeyRelease>', self.search_movies)
+        self.search_entry.bind('<KeyRelease>', self._on_search_key)
         
         search_btn = ttk.Button(
             search_frame,
@@ -154,101 +221,205 @@ class MovieManagementView(ttk.Frame):
         columns = ('ID', 'Title', 'Director', 'Genre', 'Year', 'Duration', 'Rate', 'Stock', 'Available')
         self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=15)
         
-        # Define headings
+        # Define headings with fixed, non-stretching widths so inserts don't re-measure columns
         for col in columns:
             self.tree.heading(col, text=col)
-            self.tree.column(col, width=80)
+            self.tree.column(col, width=COL_WIDTHS.get(col, DEFAULT_COL_WIDTH),
+                             stretch=tk.NO, anchor=tk.W)
         
-        # Specific column widths
-        self.tree.column('Title', width=150)
-        self.tree.column('Director', width=120)
-        self.tree.column('Genre', width=80)
-        
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        # Scrollbar drives the visible window over all loaded movies, not the tree
+        self.scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
+        self.movies_table = VirtualTable(self.tree, self.scrollbar, self._format_movie_row,
+                                         on_scroll=self._on_table_scroll)
         
         # Pack tree and scrollbar
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Bind selection event
         self.tree.bind('<<TreeviewSelect>>', self.on_movie_select)
     
     def apply_styling(self):
         """Apply styling to widgets."""
+        global _STYLES_REGISTERED
+        if _STYLES_REGISTERED:
+            return
+        
         style = ttk.Style()
         
         # Color buttons
-        for color, hex_color in [('#27ae60', '#27ae60'), ('#3498db', '#3498db'), 
-                               ('#e74c3c', '#e74c3c'), ('#95a5a6', '#95a5a6')]:
-            style.configure(f'{color}.TButton', background=hex_color, foreground='white')
+        for color in ('#27ae60', '#3498db', '#e74c3c', '#95a5a6'):
+            style.configure(f'{color}.TButton', background=color, foreground='white')
+        
+        _STYLES_REGISTERED = True
+    
+    def _on_table_scroll(self, start, stop):
+        """Fetch the next page when the visible window nears the end of the loaded movies."""
+        if not self._exhausted and stop > len(self.movies_table.rows) * 0.9:
+            self._load_next_page()
+    
+    def _run_async(self, callback, func, *args, **kwargs):
+        """Run a model call on the worker pool and pass its result to callback on the Tk thread."""
+        future = self._executor.submit(func, *args, **kwargs)
+        self._deliver_when_done(future, callback)
+        return future
+    
+    def _deliver_when_done(self, future, callback):
+        """Schedule callback on the Tk thread once future completes."""
+        future.add_done_callback(lambda f: self.after(0, self._deliver, callback, f))
+    
+    def _deliver(self, callback, future):
+        """Invoke a result callback if the view still exists."""
+        if self.winfo_exists():
+            callback(future.result())
     
     def load_movies(self):
-        """Load all movies into the table."""
-        success, message, movies = self.movie_model.get_all_movies()
-        if success:
-            self.populate_table(movies)
+        """Load the first page of movies into the table."""
+        self._start_query({})
+    
+    def _start_query(self, query):
+        """Reset paging for a new query and load its first page."""
+        self._generation += 1
+        self._current_query = query
+        self._offset = 0
+        self._exhausted = False
+        self._loading = False
+        self._prefetched_next = None
+        self._load_next_page()
+    
+    def _load_next_page(self):
+        """Fetch the next page of the current query in the background."""
+        if self._loading:
+            return
+        
+        callback = partial(self._apply_page, self._generation)
+        
+        # First pages of searches are served from the LRU cache when possible
+        search_term = self._current_query.get('title')
+        if self._offset == 0 and search_term in self._search_cache:
+            self._search_cache.move_to_end(search_term)
+            callback(self._search_cache[search_term])
+            return
+        
+        self._loading = True
+        
+        # Consume the speculatively prefetched page if it matches this request
+        prefetched, self._prefetched_next = self._prefetched_next, None
+        if prefetched is not None and prefetched[0] == (self._generation, self._offset):
+            self._deliver_when_done(prefetched[1], callback)
         else:
+            self._run_async(
+                callback,
+                self.movie_model.search_movies,
+                limit=self._page_size, offset=self._offset, **self._current_query
+            )
+    
+    def _prefetch_next_page(self):
+        """Fetch the page after the loaded rows before the user scrolls to it."""
+        future = self._executor.submit(
+            self.movie_model.search_movies,
+            limit=self._page_size, offset=self._offset, **self._current_query
+        )
+        self._prefetched_next = ((self._generation, self._offset), future)
+    
+    def _apply_page(self, generation, result):
+        """Show a fetched page: the first page replaces the table, later ones append."""
+        if generation != self._generation:
+            return
+        
+        self._loading = False
+        success, message, movies = result
+        if not success:
+            self._exhausted = True
             messagebox.showerror("Error", message)
+            return
+        
+        first_page = self._offset == 0
+        search_term = self._current_query.get('title')
+        if first_page and search_term:
+            self._cache_search(search_term, result)
+        
+        self._offset += len(movies)
+        self._exhausted = len(movies) < self._page_size
+        if first_page:
+            self.populate_table(movies)
+        else:
+            self.append_rows(movies)
+        
+        if not self._exhausted:
+            self._prefetch_next_page()
     
     def populate_table(self, movies):
         """Populate table with movie data."""
-        # Clear existing data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add movies to table
         for movie in movies:
-            self.tree.insert('', tk.END, values=(
-                movie['movie_id'],
-                movie['title'],
-                movie['director'] or '',
-                movie['genre'] or '',
-                movie['release_year'] or '',
-                movie['duration'] or '',
-                f"${movie['rental_rate']:.2f}",
-                movie['stock_quantity'],
-                'Yes' if movie['is_available'] else 'No'
-            ))
+            self._cache_display_fields(movie)
+        self._movies_by_id = {m['movie_id']: m for m in movies}
+        self.movies_table.set_rows(movies)
+    
+    def append_rows(self, movies):
+        """Append movies to the loaded list and refresh the visible window."""
+        if movies:
+            for movie in movies:
+                self._cache_display_fields(movie)
+            self.movies_table.rows.extend(movies)
+            self._movies_by_id.update((m['movie_id'], m) for m in movies)
+            self.movies_table.refresh()
+    
+    @staticmethod
+    def _cache_display_fields(movie):
+        """Format display strings once per movie so scrolling doesn't re-stringify them."""
+        movie['_rate_str'] = f"${movie['rental_rate']:.2f}"
+    
+    @staticmethod
+    def _format_movie_row(m):
+        """Format a movie as a table row; the movie ID is the item ID."""
+        values = (
+            m['movie_id'],
+            m['title'],
+            m['director'] or '',
+            m['genre'] or '',
+            m['release_year'] or '',
+            m['duration'] or '',
+            m['_rate_str'],
+            m['stock_quantity'],
+            'Yes' if m['is_available'] else 'No'
+        )
+        return m['movie_id'], values, ()
     
     def on_movie_select(self, event):
         """Handle movie selection from table."""
         selection = self.tree.selection()
         if selection:
-            item = selection[0]
-            values = self.tree.item(item, 'values')
-            self.selected_movie_id = int(values[0])
-            self.populate_form(values)
+            # Item IDs are movie IDs
+            movie = self._movies_by_id[int(selection[0])]
+            self.selected_movie_id = movie['movie_id']
+            self.populate_form(movie)
     
-    def populate_form(self, values):
+    def populate_form(self, movie):
         """Populate form with selected movie data."""
         self.title_entry.delete(0, tk.END)
-        self.title_entry.insert(0, values[1])
+        self.title_entry.insert(0, movie['title'])
         
         self.director_entry.delete(0, tk.END)
-        self.director_entry.insert(0, values[2])
+        self.director_entry.insert(0, movie['director'] or '')
         
         self.genre_entry.delete(0, tk.END)
-        self.genre_entry.insert(0, values[3])
+        self.genre_entry.insert(0, movie['genre'] or '')
         
         self.year_entry.delete(0, tk.END)
-        self.year_entry.insert(0, values[4])
+        self.year_entry.insert(0, movie['release_year'] or '')
         
         self.duration_entry.delete(0, tk.END)
-        self.duration_entry.insert(0, values[5])
+        self.duration_entry.insert(0, movie['duration'] or '')
         
-        # Remove $ from rate
-        rate = values[6].replace('$', '')
         self.rate_entry.delete(0, tk.END)
-        self.rate_entry.insert(0, rate)
+        self.rate_entry.insert(0, str(movie['rental_rate']))
         
-        # For copies, we'd need to get the actual movie data
-        # This is a simplification
         self.copies_entry.delete(0, tk.END)
-        self.copies_entry.insert(0, values[7])
+        self.copies_entry.insert(0, movie['total_copies'])
         
         self.desc_text.delete('1.0', tk.END)
+        self.desc_text.insert('1.0', movie['description'] or '')
     
     def get_form_data(self):
         """Get and validate form data."""
@@ -263,26 +434,27 @@ class MovieManagementView(ttk.Frame):
         
         # Validate required fields
         if not title:
-            messagebox.showerror("Error", "Title is required")
-            return None
+            return self._show_validation_error("Title is required")
         
         if not rate:
-            messagebox.showerror("Error", "Rental rate is required")
-            return None
+            return self._show_validation_error("Rental rate is required")
         
         if not copies:
-            messagebox.showerror("Error", "Total copies is required")
-            return None
-        
-        # Convert numeric fields
-        try:
-            release_year = int(year) if year else None
-            duration_min = int(duration) if duration else None
-            rental_rate = float(rate)
-            total_copies = int(copies)
-        except ValueError:
-            messagebox.showerror("Error", "Please enter valid numbers for numeric fields")
-            return None
+            return self._show_validation_error("Total copies is required")
+        
+        # Validate and convert numeric fields
+        if ((year and not _INT_RE.match(year)) or
+                (duration and not _INT_RE.match(duration)) or
+                not _FLOAT_RE.match(rate) or
+                not _INT_RE.match(copies)):
+            return self._show_validation_error("Please enter valid numbers for numeric fields")
+        
+        self._status.configure(text="")
+        
+        release_year = int(year) if year else None
+        duration_min = int(duration) if duration else None
+        rental_rate = float(rate)
+        total_copies = int(copies)
         
         return {
             'title': title,
@@ -295,19 +467,48 @@ class MovieManagementView(ttk.Frame):
             'total_copies': total_copies
         }
     
+    def _show_validation_error(self, message):
+        """Show a validation error in the status label; returns None for get_form_data."""
+        self._status.configure(text=message)
+        return None
+    
     def add_movie(self):
         """Add new movie."""
         data = self.get_form_data()
         if not data:
             return
         
-        success, message, movie_id = self.movie_model.add_movie(**data)
-        if success:
-            messagebox.showinfo("Success", message)
-            self.clear_form()
-            self.load_movies()
-        else:
+        self._run_async(partial(self._on_movie_added, data), self.movie_model.add_movie, **data)
+    
+    def _on_movie_added(self, data, result):
+        """Handle the result of adding a movie."""
+        success, message, movie_id = result
+        if not success:
             messagebox.showerror("Error", message)
+            return
+        
+        self._search_cache.clear()
+        messagebox.showinfo("Success", message)
+        self.clear_form()
+        
+        if self.search_entry.get().strip():
+            # The new movie may not match the active search, so re-run it
+            self.search_movies()
+            return
+        
+        movie = dict(data, movie_id=movie_id, stock_quantity=data['total_copies'],
+                     is_available=True, created_at=None)
+        self._cache_display_fields(movie)
+        
+        # Insert at its title position; rows sorting past the loaded range arrive with a later page
+        rows = self.movies_table.rows
+        index = bisect_right(rows, movie['title'].lower(), key=lambda m: m['title'].lower())
+        if index < len(rows) or self._exhausted:
+            rows.insert(index, movie)
+            self._movies_by_id[movie_id] = movie
+            self._offset += 1
+            self._prefetched_next = None
+            self.movies_table.refresh()
     
     def update_movie(self):
         """Update selected movie."""
@@ -319,13 +520,26 @@ class MovieManagementView(ttk.Frame):
         if not data:
             return
         
-        success, message = self.movie_model.update_movie(self.selected_movie_id, **data)
-        if success:
-            messagebox.showinfo("Success", message)
-            self.clear_form()
-            self.load_movies()
-        else:
+        movie_id = self.selected_movie_id
+        self._run_async(partial(self._on_movie_updated, movie_id, data),
+                        self.movie_model.update_movie, movie_id, **data)
+    
+    def _on_movie_updated(self, movie_id, data, result):
+        """Handle the result of updating a movie, patching the loaded row in place."""
+        success, message = result
+        if not success:
             messagebox.showerror("Error", message)
+            return
+        
+        self._search_cache.clear()
+        messagebox.showinfo("Success", message)
+        self.clear_form()
+        
+        movie = self._movies_by_id.get(movie_id)
+        if movie is not None:
+            movie.update(data)
+            self._cache_display_fields(movie)
+            self.movies_table.refresh()
     
     def delete_movie(self):
         """Delete selected movie."""
@@ -334,26 +548,55 @@ class MovieManagementView(ttk.Frame):
             return
         
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this movie?"):
-            success, message = self.movie_model.delete_movie(self.selected_movie_id)
-            if success:
-                messagebox.showinfo("Success", message)
-                self.clear_form()
-                self.load_movies()
-            else:
-                messagebox.showerror("Error", message)
+            movie_id = self.selected_movie_id
+            self._run_async(partial(self._on_movie_deleted, movie_id),
+                            self.movie_model.delete_movie, movie_id)
+    
+    def _on_movie_deleted(self, movie_id, result):
+        """Handle the result of deleting a movie, dropping the loaded row."""
+        success, message = result
+        if not success:
+            messagebox.showerror("Error", message)
+            return
+        
+        self._search_cache.clear()
+        messagebox.showinfo("Success", message)
+        self.clear_form()
+        
+        movie = self._movies_by_id.pop(movie_id, None)
+        if movie is not None:
+            self.movies_table.rows.remove(movie)
+            self._offset -= 1
+            self._prefetched_next = None
+            self.movies_table.scroll_to(self.movies_table.window_start)
+    
+    def _on_search_key(self, event):
+        """Debounce typing so a burst of keystrokes runs a single search."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self.search_movies)
     
     def search_movies(self, event=None):
         """Search movies based on search term."""
-        search_term = self.search_entry.get().strip()
+        if self._search_after_id:
+            # Explicit searches supersede a pending debounced one
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = None
+        
+        search_term = self.search_entry.get().strip().lower()
         if not search_term:
             self.load_movies()
             return
         
-        success, message, movies = self.movie_model.search_movies(title=search_term)
-        if success:
-            self.populate_table(movies)
-        else:
-            messagebox.showerror("Error", message)
+        self._start_query({'title': search_term})
+    
+    def _cache_search(self, search_term, result):
+        """Store a search's first page in the LRU cache, evicting the oldest term."""
+        cache = self._search_cache
+        cache[search_term] = result
+        cache.move_to_end(search_term)
+        if len(cache) > SEARCH_CACHE_SIZE:
+            cache.popitem(last=False)
     
     def clear_search(self):
         """Clear search and show all movies."""
@@ -370,6 +613,7 @@ class MovieManagementView(ttk.Frame):
         self.rate_entry.delete(0, tk.END)
         self.copies_entry.delete(0, tk.END)
         self.desc_text.delete('1.0', tk.END)
+        self._status.configure(text="")
         self.selected_movie_id = None
         
         # Clear tree selection
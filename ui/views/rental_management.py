@@ -4,14 +4,165 @@ Rental Management GUI
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 import logging
+import math
 from models.rental_model import RentalModel
 from models.movie_model import MovieModel
 from models.customer_model import CustomerModel
+from config import get_connection_pool
+from ui.components.custom_widgets import VirtualTable
 
 logger = logging.getLogger(__name__)
 
+PAGE_SIZES = (50, 100, 250, 500)
+TYPEAHEAD_DEBOUNCE_MS = 200
+TYPEAHEAD_LIMIT = 20
+FILTER_DEBOUNCE_MS = 200
+
+# Fixed column widths, in display order, for the rentals and return tables
+RENTAL_COL_WIDTHS = {
+    'Rental ID': 90, 'Customer': 120, 'Movie': 150, 'Rental Date': 100, 'Due Date': 100,
+    'Return Date': 100, 'Status': 90, 'Total Charge': 90, 'Late Fee': 90,
+}
+RETURN_COL_WIDTHS = {
+    'Rental ID': 100, 'Customer': 120, 'Movie': 150, 'Rental Date': 100, 'Due Date': 100,
+    'Days Overdue': 100,
+}
+
+class _TypeAhead:
+    """Entry that queries matches as the user types and offers them in a dropdown list."""
+    
+    def __init__(self, parent, run_async, search, format_item, on_pick, width=40):
+        self.run_async = run_async      # (callback, func, *args) -> runs func off the Tk thread
+        self.search = search            # term -> (success, message, items)
+        self.format_item = format_item  # item -> display text
+        self.on_pick = on_pick          # called with the picked item, or None when cleared
+        self.items = []
+        self._term = ''
+        self._after_id = None
+        self._generation = 0
+        
+        self.var = tk.StringVar()
+        self.entry = ttk.Entry(parent, textvariable=self.var, width=width)
+        self.entry.bind('<KeyRelease>', self._on_key)
+        self.entry.bind('<Down>', lambda event: self._move(1))
+        self.entry.bind('<Up>', lambda event: self._move(-1))
+        self.entry.bind('<Return>', self._pick_active)
+        self.entry.bind('<Escape>', lambda event: self.hide())
+        self.entry.bind('<FocusOut>', lambda event: self.entry.after(150, self.hide))
+        self.entry.bind('<Destroy>', self._on_destroy)
+        
+        # Undecorated popup holding the match list, shown under the entry
+        self.popup = tk.Toplevel(self.entry)
+        self.popup.overrideredirect(True)
+        self.popup.withdraw()
+        self.listbox = tk.Listbox(self.popup, width=width, height=10, exportselection=False)
+        self.listbox.pack(fill=tk.BOTH, expand=True)
+        self.listbox.bind('<Button-1>', lambda event: self._pick(self.listbox.nearest(event.y)))
+    
+    def _on_key(self, event):
+        """Schedule a search once typing pauses; navigation keys leave the text unchanged."""
+        term = self.var.get().strip()
+        if term == self._term:
+            return
+        
+        self._term = term
+        self.on_pick(None)  # the text no longer names a picked item
+        if self._after_id:
+            self.entry.after_cancel(self._after_id)
+        self._after_id = self.entry.after(TYPEAHEAD_DEBOUNCE_MS, self._search)
+    
+    def _search(self):
+        """Query matches for the current text in the background."""
+        self._after_id = None
+        self._generation += 1
+        if not self._term:
+            self.hide()
+            return
+        self.run_async(partial(self._apply_matches, self._generation), self.search, self._term)
+    
+    def _apply_matches(self, generation, result):
+        """Show the matches unless the text changed since they were requested."""
+        if generation != self._generation or not self.entry.winfo_exists():
+            return
+        
+        success, message, items = result
+        if not success:
+            logger.error(f"Type-ahead search failed: {message}")
+            items = []
+        
+        self.items = items
+        self.listbox.delete(0, tk.END)
+        if items:
+            self.listbox.insert(tk.END, *[self.format_item(item) for item in items])
+            self.show()
+        else:
+            self.hide()
+    
+    def show(self):
+        """Show the match list under the entry."""
+        x = self.entry.winfo_rootx()
+        y = self.entry.winfo_rooty() + self.entry.winfo_height()
+        self.popup.geometry(f"+{x}+{y}")
+        self.popup.deiconify()
+        self.popup.lift()
+    
+    def hide(self):
+        """Hide the match list."""
+        if self.popup.winfo_exists():
+            self.popup.withdraw()
+    
+    def clear(self):
+        """Empty the entry and forget any picked item."""
+        self.var.set('')
+        self._term = ''
+        self.items = []
+        self.hide()
+        self.on_pick(None)
+    
+    def _move(self, step):
+        """Move the highlighted match with the arrow keys."""
+        if not self.items:
+            return 'break'
+        
+        self.show()
+        current = self.listbox.curselection()
+        index = current[0] + step if current else 0
+        index = max(0, min(index, len(self.items) - 1))
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.see(index)
+        return 'break'
+    
+    def _pick_active(self, event):
+        """Pick the highlighted match with Return."""
+        current = self.listbox.curselection()
+        if current:
+            self._pick(current[0])
+        return 'break'
+    
+    def _pick(self, index):
+        """Fill the entry with a match and report it."""
+        if not 0 <= index < len(self.items):
+            return
+        
+        item = self.items[index]
+        self._term = self.format_item(item)
+        self.var.set(self._term)
+        self.entry.icursor(tk.END)
+        self.hide()
+        self.on_pick(item)
+    
+    def _on_destroy(self, event):
+        """Cancel a pending search when the entry goes away."""
+        if event.widget is self.entry and self._after_id:
+            self.entry.after_cancel(self._after_id)
+            self._after_id = None
+
+
 class RentalManagementView(ttk.Frame):
     """Rental management interface with rent/return functionality."""
     
@@ -19,14 +170,53 @@ class RentalManagementView(ttk.Frame):
         super().__init__(parent)
         self.parent = parent
         self.employee_data = employee_data
-        self.rental_model = RentalModel()
-        self.movie_model = MovieModel()
-        self.customer_model = CustomerModel()
+        
+        # All three models draw from one shared pool of warm connections
+        pool = get_connection_pool()
+        self.rental_model = RentalModel(pool=pool)
+        self.movie_model = MovieModel(pool=pool)
+        self.customer_model = CustomerModel(pool=pool)
+        
+        # Virtualized tables for the current mode, created with their trees
+        self.rentals_table = None
+        self.return_table = None
+        
+        # Server-side paging of the current mode's rental query
+        self.page_size = 100
+        self.page = 0
+        self.total_rows = 0
+        self._page_fetch = None
+        self._page_populate = None
+        self._page_future = None
+        self._filter_after_id = None
+        
+        # Customer and movie picked in the rent form, as returned by their searches
+        self.selected_customer = None
+        self.selected_movie = None
+        
+        # Active rentals shown in the return table, by rental ID
+        self._return_rentals = {}
+        
+        # Model calls run on worker threads; results are applied on the Tk thread.
+        # The mode counter drops results meant for a mode the user has since left,
+        # the query/page counters drop counts and pages superseded by newer requests.
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._mode = 0
+        self._query_generation = 0
+        self._page_generation = 0
+        self._busy = 0
         
         self.create_widgets()
         self.apply_styling()
         self.show_view_rentals()  # Default view
     
+    def destroy(self):
+        """Cancel pending callbacks and stop the worker pool before destroying the view."""
+        self._cancel_filter_load()
+        self._cancel_tables()
+        self._executor.shutdown(wait=False)
+        super().destroy()
+    
     def create_widgets(self):
         """Create rental management widgets."""
         # Title
@@ -67,9 +257,45 @@ class RentalManagementView(ttk.Frame):
     
     def clear_content(self):
         """Clear the content area."""
+        self._mode += 1
+        self._cancel_filter_load()
+        self._cancel_tables()
         for widget in self.content_frame.winfo_children():
             widget.destroy()
     
+    def _cancel_tables(self):
+        """Cancel pending renders of the current mode's tables."""
+        for table in (self.rentals_table, self.return_table):
+            if table is not None:
+                table.cancel()
+        self.rentals_table = self.return_table = None
+    
+    def _run_async(self, callback, func, *args, **kwargs):
+        """Run a model call on the worker pool and pass its result to callback in the current mode."""
+        future = self._executor.submit(func, *args, **kwargs)
+        self._deliver_when_done(future, callback, self._mode)
+        return future
+    
+    def _deliver_when_done(self, future, callback, mode=None):
+        """Schedule callback on the Tk thread once future completes; mode None delivers in any mode."""
+        self._set_busy(True)
+        future.add_done_callback(lambda f: self.after(0, self._deliver, callback, f, mode))
+    
+    def _deliver(self, callback, future, mode):
+        """Invoke a result callback unless cancelled or the view or its mode is gone."""
+        if not self.winfo_exists():
+            return
+        self._set_busy(False)
+        if future.cancelled():
+            return
+        if mode is None or mode == self._mode:
+            callback(future.result())
+    
+    def _set_busy(self, busy):
+        """Show a busy cursor while any model call is in flight."""
+        self._busy += 1 if busy else -1
+        self.configure(cursor='watch' if self._busy else '')
+    
     def show_view_rentals(self):
         """Show view rentals interface."""
         self.clear_content()
@@ -88,9 +314,10 @@ class RentalManagementView(ttk.Frame):
                                    values=["all", "active", "returned", "overdue"], 
                                    state="readonly", width=10)
         status_combo.pack(side=tk.LEFT, padx=(0, 15))
+        status_combo.bind('<<ComboboxSelected>>', self._debounced_load)
         
         ttk.Button(filter_options, text="Apply Filters", 
-                  command=self.load_rentals).pack(side=tk.LEFT, padx=5)
+                  command=self._debounced_load).pack(side=tk.LEFT, padx=5)
         
         ttk.Button(filter_options, text="Show Overdue", 
                   command=self.show_overdue_rentals, style='Warning.TButton').pack(side=tk.LEFT, padx=5)
@@ -100,6 +327,7 @@ class RentalManagementView(ttk.Frame):
         results_frame.pack(fill=tk.BOTH, expand=True)
         
         self.create_rentals_table(results_frame)
+        self.create_pager(results_frame)
         self.load_rentals()
     
     def show_rent_movie(self):
@@ -114,28 +342,23 @@ class RentalManagementView(ttk.Frame):
         customer_frame.pack(fill=tk.X, pady=10)
         
         ttk.Label(customer_frame, text="Select Customer:").pack(side=tk.LEFT)
-        self.customer_var = tk.StringVar()
-        self.customer_combo = ttk.Combobox(customer_frame, textvariable=self.customer_var, 
-                                          state="readonly", width=40)
-        self.customer_combo.pack(side=tk.LEFT, padx=10)
-        self.customer_combo.bind('<<ComboboxSelected>>', self.on_customer_select)
-        
-        ttk.Button(customer_frame, text="Refresh", 
-                  command=self.load_customers).pack(side=tk.LEFT)
+        self.customer_search = _TypeAhead(
+            customer_frame, self._run_async,
+            partial(self.customer_model.search_customers, limit=TYPEAHEAD_LIMIT),
+            self._format_customer, self.on_customer_select
+        )
+        self.customer_search.entry.pack(side=tk.LEFT, padx=10)
         
         # Movie selection
         movie_frame = ttk.Frame(form_frame)
         movie_frame.pack(fill=tk.X, pady=10)
         
         ttk.Label(movie_frame, text="Select Movie:").pack(side=tk.LEFT)
-        self.movie_var = tk.StringVar()
-        self.movie_combo = ttk.Combobox(movie_frame, textvariable=self.movie_var, 
-                                       state="readonly", width=40)
-        self.movie_combo.pack(side=tk.LEFT, padx=10)
-        self.movie_combo.bind('<<ComboboxSelected>>', self.on_movie_select)
-        
-        ttk.Button(movie_frame, text="Refresh", 
-                  command=self.load_available_movies).pack(side=tk.LEFT)
+        self.movie_search = _TypeAhead(
+            movie_frame, self._run_async, self._search_available_movies,
+            self._format_movie, self.on_movie_select
+        )
+        self.movie_search.entry.pack(side=tk.LEFT, padx=10)
         
         # Due date
         due_frame = ttk.Frame(form_frame)
@@ -158,13 +381,12 @@ class RentalManagementView(ttk.Frame):
         self.rental_info_label.pack()
         
         # Rent button
-        rent_btn = ttk.Button(form_frame, text="Rent Movie", 
-                             command=self.rent_movie, style='Success.TButton')
-        rent_btn.pack(pady=20)
+        self.rent_btn = ttk.Button(form_frame, text="Rent Movie", 
+                                  command=self.rent_movie, style='Success.TButton')
+        self.rent_btn.pack(pady=20)
         
-        # Load data
-        self.load_customers()
-        self.load_available_movies()
+        self.selected_customer = None
+        self.selected_movie = None
     
     def show_return_movie(self):
         """Show return movie interface."""
@@ -181,24 +403,26 @@ class RentalManagementView(ttk.Frame):
         tree_frame = ttk.Frame(form_frame)
         tree_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        columns = ('Rental ID', 'Customer', 'Movie', 'Rental Date', 'Due Date', 'Days Overdue')
-        self.return_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=10)
+        self.return_tree = ttk.Treeview(tree_frame, columns=tuple(RETURN_COL_WIDTHS),
+                                        show='headings', height=10)
         
-        for col in columns:
+        for col, width in RETURN_COL_WIDTHS.items():
             self.return_tree.heading(col, text=col)
-            self.return_tree.column(col, width=100)
+            self.return_tree.column(col, width=width, stretch=tk.NO)
         
-        self.return_tree.column('Customer', width=120)
-        self.return_tree.column('Movie', width=150)
+        self.return_tree.tag_configure('overdue', foreground='#c0392b')
         
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.return_tree.yview)
-        self.return_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
         
         self.return_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        self.return_table = VirtualTable(self.return_tree, scrollbar, self._format_return_row)
+        
         self.return_tree.bind('<<TreeviewSelect>>', self.on_return_select)
         
+        self.create_pager(form_frame)
+        
         # Return info
         self.return_info_frame = ttk.LabelFrame(form_frame, text="Return Information", padding=10)
         self.return_info_frame.pack(fill=tk.X, pady=10)
@@ -222,29 +446,47 @@ class RentalManagementView(ttk.Frame):
         tree_frame.pack(fill=tk.BOTH, expand=True)
         
         # Create treeview
-        columns = ('Rental ID', 'Customer', 'Movie', 'Rental Date', 'Due Date', 
-                  'Return Date', 'Status', 'Total Charge', 'Late Fee')
-        self.rentals_tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=15)
+        self.rentals_tree = ttk.Treeview(tree_frame, columns=tuple(RENTAL_COL_WIDTHS),
+                                         show='headings', height=15)
         
-        # Define headings
-        for col in columns:
+        # Define headings with fixed, non-stretching widths in one pass
+        for col, width in RENTAL_COL_WIDTHS.items():
             self.rentals_tree.heading(col, text=col)
-            self.rentals_tree.column(col, width=90)
+            self.rentals_tree.column(col, width=width, stretch=tk.NO)
         
-        # Specific column widths
-        self.rentals_tree.column('Customer', width=120)
-        self.rentals_tree.column('Movie', width=150)
-        self.rentals_tree.column('Rental Date', width=100)
-        self.rentals_tree.column('Due Date', width=100)
-        self.rentals_tree.column('Return Date', width=100)
+        # Overdue highlighting lives in a Tk tag, not in the row values
+        self.rentals_tree.tag_configure('overdue', foreground='#c0392b')
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.rentals_tree.yview)
-        self.rentals_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
         
         # Pack tree and scrollbar
         self.rentals_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Only the visible rows are inserted into the tree
+        self.rentals_table = VirtualTable(self.rentals_tree, scrollbar, self._format_rental_row)
+    
+    def create_pager(self, parent):
+        """Create Prev/Next paging controls with a page size selector."""
+        pager = ttk.Frame(parent)
+        pager.pack(fill=tk.X, pady=(5, 0))
+        
+        self.prev_btn = ttk.Button(pager, text="◀ Prev", command=self.prev_page, width=8)
+        self.prev_btn.pack(side=tk.LEFT)
+        
+        self.page_label = ttk.Label(pager, text="")
+        self.page_label.pack(side=tk.LEFT, padx=10)
+        
+        self.next_btn = ttk.Button(pager, text="Next ▶", command=self.next_page, width=8)
+        self.next_btn.pack(side=tk.LEFT)
+        
+        self.page_size_var = tk.StringVar(value=str(self.page_size))
+        page_size_combo = ttk.Combobox(pager, textvariable=self.page_size_var,
+                                       values=PAGE_SIZES, state="readonly", width=5)
+        page_size_combo.pack(side=tk.RIGHT)
+        page_size_combo.bind('<<ComboboxSelected>>', self.on_page_size_change)
+        ttk.Label(pager, text="Rows per page:").pack(side=tk.RIGHT, padx=(0, 5))
     
     def apply_styling(self):
         """Apply styling to widgets."""
@@ -263,182 +505,262 @@ class RentalManagementView(ttk.Frame):
         status = self.status_var.get()
         status = None if status == "all" else status
         
-        success, message, rentals = self.rental_model.search_rentals(status=status)
+        self.start_paging(
+            partial(self.rental_model.search_rentals, status=status),
+            partial(self.rental_model.count_rentals, status=status),
+            self.populate_rentals_table
+        )
+    
+    def _debounced_load(self, event=None):
+        """Reload rentals once filter changes and clicks settle."""
+        self._cancel_filter_load()
+        self._filter_after_id = self.after(FILTER_DEBOUNCE_MS, self._run_filter_load)
+    
+    def _run_filter_load(self):
+        """Run the debounced rentals load."""
+        self._filter_after_id = None
+        self.load_rentals()
+    
+    def _cancel_filter_load(self):
+        """Cancel a pending debounced rentals load."""
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+    
+    def start_paging(self, fetch, count, populate):
+        """Page a new rental query from its first page, counting its rows once."""
+        self._page_fetch = fetch
+        self._page_populate = populate
+        self.page = 0
+        self.total_rows = 0
+        
+        self._query_generation += 1
+        self._run_async(partial(self._apply_count, self._query_generation), count)
+        self.load_page()
+    
+    def _apply_count(self, generation, result):
+        """Record the row count of the active query unless a newer query superseded it."""
+        if generation != self._query_generation:
+            return
+        
+        success, message, total = result
+        if not success:
+            messagebox.showerror("Error", message)
+        self.total_rows = total
+        self.update_pager()
+    
+    def load_page(self):
+        """Fetch the current page of the active rental query in the background."""
+        # A superseded page request that hasn't started yet needn't hit the database
+        if self._page_future is not None:
+            self._page_future.cancel()
+        
+        self._page_generation += 1
+        self._page_future = self._run_async(
+            partial(self._apply_page, self._page_generation),
+            self._page_fetch,
+            limit=self.page_size, offset=self.page * self.page_size
+        )
+    
+    def _apply_page(self, generation, result):
+        """Show a fetched page unless a newer page request superseded it."""
+        if generation != self._page_generation:
+            return
+        
+        success, message, rentals = result
         if success:
-            self.populate_rentals_table(rentals)
+            self._page_populate(rentals)
+            self.update_pager()
         else:
             messagebox.showerror("Error", message)
     
+    def update_pager(self):
+        """Refresh the page label and Prev/Next button states."""
+        page_count = max(1, math.ceil(self.total_rows / self.page_size))
+        self.page_label.config(text=f"Page {self.page + 1} of {page_count} ({self.total_rows} rentals)")
+        self.prev_btn.config(state='normal' if self.page > 0 else 'disabled')
+        self.next_btn.config(state='normal' if self.page + 1 < page_count else 'disabled')
+    
+    def prev_page(self):
+        """Show the previous page."""
+        if self.page > 0:
+            self.page -= 1
+            self.load_page()
+    
+    def next_page(self):
+        """Show the next page."""
+        if (self.page + 1) * self.page_size < self.total_rows:
+            self.page += 1
+            self.load_page()
+    
+    def on_page_size_change(self, event):
+        """Reload from the first page with the new page size."""
+        self.page_size = int(self.page_size_var.get())
+        self.page = 0
+        self.load_page()
+    
     def populate_rentals_table(self, rentals):
         """Populate rentals table with data."""
-        # Clear existing data
-        for item in self.rentals_tree.get_children():
-            self.rentals_tree.delete(item)
-        
-        # Add rentals to table
-        for rental in rentals:
-            self.rentals_tree.insert('', tk.END, values=(
-                rental['rental_id'],
-                f"{rental['customer_first_name']} {rental['customer_last_name']}",
-                rental['movie_title'],
-                rental['rental_date'].strftime('%Y-%m-%d'),
-                rental['due_date'].strftime('%Y-%m-%d'),
-                rental['actual_return_date'].strftime('%Y-%m-%d') if rental['actual_return_date'] else '',
-                rental['rental_status'].title(),
-                f"${rental['total_charge']:.2f}",
-                f"${rental['late_fee']:.2f}"
-            ))
+        self.rentals_table.set_rows(rentals)
+    
+    @staticmethod
+    def _format_rental_row(rental):
+        """Build the (item ID, values, tags) triple for a rentals table row."""
+        overdue = rental['days_overdue'] > 0 and not rental['actual_return_date']
+        return rental['rental_id'], (
+            rental['rental_id'],
+            rental['customer_name'],
+            rental['movie_title'],
+            rental['rental_date_s'],
+            rental['due_date_s'],
+            rental['return_date_s'],
+            rental['status_s'],
+            rental['total_charge_s'],
+            rental['late_fee_s']
+        ), ('overdue',) if overdue else ()
     
     def show_overdue_rentals(self):
         """Show overdue rentals."""
-        success, message, rentals = self.rental_model.get_overdue_rentals()
-        if success:
-            self.populate_rentals_table(rentals)
-        else:
-            messagebox.showerror("Error", message)
+        self._cancel_filter_load()
+        self.status_var.set('overdue')
+        self.load_rentals()
     
-    def load_customers(self):
-        """Load customers for combo box."""
-        success, message, customers = self.customer_model.get_all_customers()
-        if success:
-            customer_list = [f"{c['customer_id']}: {c['first_name']} {c['last_name']}" for c in customers]
-            self.customer_combo['values'] = customer_list
-        else:
-            messagebox.showerror("Error", message)
+    def _search_available_movies(self, term):
+        """Search available movies by title for the movie type-ahead."""
+        return self.movie_model.search_available_movies(term, limit=TYPEAHEAD_LIMIT)
     
-    def load_available_movies(self):
-        """Load available movies for combo box."""
-        success, message, movies = self.movie_model.search_movies(available_only=True)
-        if success:
-            movie_list = [f"{m['movie_id']}: {m['title']} (${m['rental_rate']:.2f}/day)" for m in movies]
-            self.movie_combo['values'] = movie_list
-        else:
-            messagebox.showerror("Error", message)
+    @staticmethod
+    def _format_customer(customer):
+        """Display text for a customer match."""
+        return f"{customer['customer_id']}: {customer['first_name']} {customer['last_name']}"
+    
+    @staticmethod
+    def _format_movie(movie):
+        """Display text for a movie match."""
+        return f"{movie['movie_id']}: {movie['title']} (${movie['rental_rate']:.2f}/day)"
     
-    def on_customer_select(self, event):
+    def on_customer_select(self, customer):
         """Handle customer selection."""
+        self.selected_customer = customer
         self.update_rental_info()
     
-    def on_movie_select(self, event):
+    def on_movie_select(self, movie):
         """Handle movie selection."""
+        self.selected_movie = movie
         self.update_rental_info()
     
     def update_rental_info(self):
         """Update rental information display."""
-        customer_text = self.customer_var.get()
-        movie_text = self.movie_var.get()
+        movie = self.selected_movie
         due_date = self.due_date_var.get()
         
-        if customer_text and movie_text and due_date:
+        if self.selected_customer and movie and due_date:
             try:
-                # Extract movie ID and get movie details
-                movie_id = int(movie_text.split(':')[0])
-                success, message, movie = self.movie_model.get_movie_by_id(movie_id)
-                
-                if success:
-                    # Calculate rental days and charge
-                    rental_days = (datetime.strptime(due_date, '%Y-%m-%d') - datetime.now()).days
-                    if rental_days > 0:
-                        total_charge = movie['rental_rate'] * rental_days
-                        
-                        info_text = (f"Rental Details:\n"
-                                   f"• Movie: {movie['title']}\n"
-                                   f"• Rental Rate: ${movie['rental_rate']:.2f}/day\n"
-                                   f"• Rental Period: {rental_days} days\n"
-                                   f"• Total Charge: ${total_charge:.2f}")
-                        
-                        self.rental_info_label.config(text=info_text)
-                    else:
-                        self.rental_info_label.config(text="Error: Due date must be in the future")
+                # Calculate rental days and charge
+                rental_days = (datetime.strptime(due_date, '%Y-%m-%d') - datetime.now()).days
+                if rental_days > 0:
+                    total_charge = movie['rental_rate'] * rental_days
+                    
+                    info_text = (f"Rental Details:\n"
+                               f"• Movie: {movie['title']}\n"
+                               f"• Rental Rate: ${movie['rental_rate']:.2f}/day\n"
+                               f"• Rental Period: {rental_days} days\n"
+                               f"• Total Charge: ${total_charge:.2f}")
+                    
+                    self.rental_info_label.config(text=info_text)
                 else:
-                    self.rental_info_label.config(text="Error: Could not load movie details")
+                    self.rental_info_label.config(text="Error: Due date must be in the future")
                     
             except ValueError:
-                self.rental_info_label.config(text="Error: Invalid selection")
+                self.rental_info_label.config(text="Error: Invalid due date")
         else:
             self.rental_info_label.config(text="Select a customer and movie to see rental details")
     
     def rent_movie(self):
         """Process movie rental."""
-        customer_text = self.customer_var.get()
-        movie_text = self.movie_var.get()
         due_date_str = self.due_date_var.get()
         
-        if not all([customer_text, movie_text, due_date_str]):
+        if not all([self.selected_customer, self.selected_movie, due_date_str]):
             messagebox.showerror("Error", "Please select customer, movie, and due date")
             return
         
+        customer_id = self.selected_customer['customer_id']
+        movie_id = self.selected_movie['movie_id']
         try:
-            customer_id = int(customer_text.split(':')[0])
-            movie_id = int(movie_text.split(':')[0])
             due_date = datetime.strptime(due_date_str, '%Y-%m-%d').date()
-            
-            # Rent the movie
-            success, message, rental_id = self.rental_model.rent_movie(
-                customer_id, movie_id, self.employee_data['employee_id'], due_date
-            )
-            
-            if success:
-                messagebox.showinfo("Success", message)
-                # Clear form
-                self.customer_var.set('')
-                self.movie_var.set('')
-                self.load_available_movies()  # Refresh available movies
-                self.rental_info_label.config(text="Select a customer and movie to see rental details")
-            else:
-                messagebox.showerror("Error", message)
-                
-        except ValueError as e:
+        except ValueError:
             messagebox.showerror("Error", "Invalid data format")
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            return
+        
+        # Rent the movie in the background; the outcome is reported even if the mode changes
+        self.rent_btn.config(state='disabled')
+        future = self._executor.submit(
+            self.rental_model.rent_movie,
+            customer_id, movie_id, self.employee_data['employee_id'], due_date
+        )
+        self._deliver_when_done(future, partial(self._on_movie_rented, self._mode))
     
-    def load_active_rentals(self):
-        """Load active rentals for return."""
-        success, message, rentals = self.rental_model.get_active_rentals()
+    def _on_movie_rented(self, mode, result):
+        """Report a rental and reset the rent form if it is still shown."""
+        success, message, rental_id = result
         if success:
-            self.populate_return_table(rentals)
+            # Stock changed, so cached availability is stale
+            self.movie_model.invalidate_available_cache()
+            messagebox.showinfo("Success", message)
         else:
             messagebox.showerror("Error", message)
+        
+        if mode != self._mode:
+            return
+        
+        self.rent_btn.config(state='normal')
+        if success:
+            # Clear form
+            self.customer_search.clear()
+            self.movie_search.clear()
+    
+    def load_active_rentals(self):
+        """Load active rentals for return."""
+        self.start_paging(
+            self.rental_model.get_active_rentals,
+            partial(self.rental_model.count_rentals, status='active'),
+            self.populate_return_table
+        )
     
     def populate_return_table(self, rentals):
         """Populate return table with active rentals."""
-        # Clear existing data
-        for item in self.return_tree.get_children():
-            self.return_tree.delete(item)
-        
-        # Add rentals to table
-        for rental in rentals:
-            due_date = rental['due_date']
-            today = datetime.now().date()
-            days_overdue = max(0, (today - due_date).days)
-            
-            self.return_tree.insert('', tk.END, values=(
-                rental['rental_id'],
-                f"{rental['customer_first_name']} {rental['customer_last_name']}",
-                rental['movie_title'],
-                rental['rental_date'].strftime('%Y-%m-%d'),
-                due_date.strftime('%Y-%m-%d'),
-                days_overdue if days_overdue > 0 else ''
-            ))
+        # Keep the rows by ID so selection reads native values, not display strings
+        self._return_rentals = {r['rental_id']: r for r in rentals}
+        self.return_table.set_rows(rentals)
+    
+    @staticmethod
+    def _format_return_row(rental):
+        """Build the (item ID, values, tags) triple for a return table row."""
+        return rental['rental_id'], (
+            rental['rental_id'],
+            rental['customer_name'],
+            rental['movie_title'],
+            rental['rental_date_s'],
+            rental['due_date_s'],
+            rental['days_overdue'] or ''
+        ), ('overdue',) if rental['days_overdue'] > 0 else ()
     
     def on_return_select(self, event):
         """Handle rental selection for return."""
         selection = self.return_tree.selection()
-        if selection:
-            item = selection[0]
-            values = self.return_tree.item(item, 'values')
-            rental_id = int(values[0])
+        # Item IDs are rental IDs; a row may have just left the loaded page
+        rental = self._return_rentals.get(int(selection[0])) if selection else None
+        if rental:
+            rental_id = rental['rental_id']
             
-            # Calculate late fee
-            due_date = datetime.strptime(values[4], '%Y-%m-%d').date()
-            late_days, late_fee = self.rental_model.calculate_late_fee(due_date)
+            # Calculate late fee from the row's native due date (no DB call)
+            late_days, late_fee = self.rental_model.calculate_late_fee(rental['due_date'])
             
             info_text = (f"Return Details:\n"
                        f"• Rental ID: {rental_id}\n"
-                       f"• Customer: {values[1]}\n"
-                       f"• Movie: {values[2]}\n"
-                       f"• Due Date: {values[4]}\n"
+                       f"• Customer: {rental['customer_name']}\n"
+                       f"• Movie: {rental['movie_title']}\n"
+                       f"• Due Date: {rental['due_date_s']}\n"
                        f"• Days Overdue: {late_days}\n"
                        f"• Late Fee: ${late_fee:.2f}")
             
@@ -457,15 +779,31 @@ class RentalManagementView(ttk.Frame):
             return
         
         if messagebox.askyesno("Confirm Return", "Are you sure you want to return this movie?"):
-            success, message, return_data = self.rental_model.return_movie(
+            # Return the movie in the background; the outcome is reported even if the mode changes
+            self.return_btn.config(state='disabled')
+            future = self._executor.submit(
+                self.rental_model.return_movie,
                 self.selected_rental_id, self.employee_data['employee_id']
             )
-            
-            if success:
-                messagebox.showinfo("Success", message)
-                # Refresh the interface
-                self.load_active_rentals()
-                self.return_info_label.config(text="Select a rental to see return details")
-                self.return_btn.config(state='disabled')
-            else:
-                messagebox.showerror("Error", message)
\ No newline at end of file
+            self._deliver_when_done(future, partial(self._on_movie_returned, self._mode))
+    
+    def _on_movie_returned(self, mode, result):
+        """Report a return and refresh the return view if it is still shown."""
+        success, message, return_data = result
+        if success:
+            # Stock changed, so cached availability is stale
+            self.movie_model.invalidate_available_cache()
+            messagebox.showinfo("Success", message)
+        else:
+            messagebox.showerror("Error", message)
+        
+        if mode != self._mode:
+            return
+        
+        if success:
+            # Refresh the interface
+            self.selected_rental_id = None
+            self.load_active_rentals()
+            self.return_info_label.config(text="Select a rental to see return details")
+        else:
+            self.return_btn.config(state='normal')
\ No newline at end of file
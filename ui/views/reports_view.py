@@ -5,25 +5,67 @@ Reports and Analytics View - FIXED VERSION
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from utils.exporters import ReportExporter
-from utils.visualization import ModernDataVisualizer  # Updated import
+from concurrent.futures import ThreadPoolExecutor
 import os
+import subprocess
+import sys
 
 logger = logging.getLogger(__name__)
 
+CHART_DEBOUNCE_MS = 80
+
+# ttk styles are global to the Tk interpreter, so they only need registering once
+_STYLES_REGISTERED = False
+
+# Chart kind -> (visualizer data method run on the worker pool, render method run on the Tk thread)
+CHART_KINDS = {
+    'genre': ('get_genre_chart_data', 'create_modern_genre_chart'),
+    'trend': ('get_trend_chart_data', 'create_modern_trend_chart'),
+    'revenue': ('get_revenue_chart_data', 'create_modern_revenue_chart'),
+    'dashboard': ('get_dashboard_data', 'create_modern_metrics_dashboard')
+}
+
+# Resolve how to open a file with its default application once, at import
+if os.name == 'nt':
+    _open_file = os.startfile
+else:
+    _OPENER = 'open' if sys.platform == 'darwin' else 'xdg-open'
+    
+    def _open_file(path):
+        """Open path with the desktop's default application without a shell."""
+        subprocess.Popen([_OPENER, path])
+
 class ReportsView(ttk.Frame):
     """Reports and analytics interface."""
     
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
-        self.exporter = ReportExporter()
-        self.visualizer = ModernDataVisualizer()  # Updated class name
-        self.current_charts = []
+        # pandas and matplotlib take a while to import, so they load with this
+        # view (the visualizer) or on the first export (the exporter), not at startup
+        from utils.visualization import ModernDataVisualizer
+        self.exporter = None
+        self.visualizer = ModernDataVisualizer()
+        self._figure = None
+        self._canvas = None
+        self._chart_pool = ThreadPoolExecutor(max_workers=2)
+        self._chart_request = 0
+        self._chart_future = None
+        self._current_chart_kind = None
+        self._pending_chart = None
         
         self.create_widgets()
         self.apply_styling()
     
+    def destroy(self):
+        """Stop the chart worker pool along with the view."""
+        if self._pending_chart is not None:
+            self.after_cancel(self._pending_chart)
+        if self._chart_future is not None:
+            self._chart_future.cancel()
+        self._chart_pool.shutdown(wait=False)
+        super().destroy()
+    
     def create_widgets(self):
         """Create reports and analytics widgets."""
         # Title
@@ -114,28 +156,43 @@ class ReportsView(ttk.Frame):
         self.charts_container = ttk.Frame(parent)
         self.charts_container.pack(fill=tk.BOTH, expand=True)
         
+        # One figure and canvas for the chart slot; each chart redraws into it
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        self._figure = Figure(figsize=(10, 8), layout='constrained')
+        self._canvas = FigureCanvasTkAgg(self._figure, self.charts_container)
+        self._canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
         # Show default chart
         self.show_modern_genre_chart()
     
     def create_tooltip(self, widget, text):
         """Create a simple tooltip for widgets."""
+        state = {'tip': None}
+        
+        def on_leave(event=None):
+            if state['tip'] is not None:
+                state['tip'].destroy()
+                state['tip'] = None
+        
         def on_enter(event):
+            on_leave()  # a repeated Enter must not orphan the previous tooltip
             tooltip = tk.Toplevel()
             tooltip.wm_overrideredirect(True)
             tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
             label = ttk.Label(tooltip, text=text, background="#ffffe0", relief="solid", borderwidth=1)
             label.pack()
-            widget.tooltip = tooltip
-        
-        def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
+            state['tip'] = tooltip
         
         widget.bind("<Enter>", on_enter)
         widget.bind("<Leave>", on_leave)
     
     def apply_styling(self):
         """Apply styling to widgets."""
+        global _STYLES_REGISTERED
+        if _STYLES_REGISTERED:
+            return
+        
         style = ttk.Style()
         
         # Export buttons
@@ -157,83 +214,78 @@ class ReportsView(ttk.Frame):
         style.map('Chart.TButton',
                  background=[('active', '#8e44ad'),
                            ('pressed', '#7d3c98')])
+        
+        _STYLES_REGISTERED = True
     
     def clear_charts(self):
-        """Clear current charts."""
-        for chart in self.current_charts:
-            try:
-                chart.get_tk_widget().destroy()
-            except:
-                pass
-        self.current_charts = []
+        """Clear the chart figure, keeping its canvas."""
+        self._figure.clear()
+        self._canvas.draw_idle()
+    
+    def show_chart(self, kind, refresh=False):
+        """Coalesce rapid chart clicks and skip the load if kind is already showing."""
+        if kind == self._current_chart_kind and not refresh:
+            return
+        
+        self._current_chart_kind = kind
+        if self._pending_chart is not None:
+            self.after_cancel(self._pending_chart)
+        self._pending_chart = self.after(CHART_DEBOUNCE_MS, self._load_chart, kind)
+    
+    def _load_chart(self, kind):
+        """Load chart data on the worker pool; only the latest request is drawn."""
+        self._pending_chart = None
+        self._chart_request += 1
+        request_id = self._chart_request
+        if self._chart_future is not None:
+            self._chart_future.cancel()
         
-        # Clear container
-        for widget in self.charts_container.winfo_children():
-            widget.destroy()
+        data_method, _ = CHART_KINDS[kind]
+        future = self._chart_pool.submit(getattr(self.visualizer, data_method))
+        self._chart_future = future
+        future.add_done_callback(lambda f: self.after(0, self._render_chart, request_id, kind, f))
+    
+    def _render_chart(self, request_id, kind, future):
+        """Redraw the chart figure on the Tk thread unless a newer request superseded it."""
+        if request_id != self._chart_request or future.cancelled() or not self.winfo_exists():
+            return
+        
+        _, render_method = CHART_KINDS[kind]
+        getattr(self.visualizer, render_method)(self._figure, future.result())
+        self._canvas.draw_idle()
     
     def show_modern_genre_chart(self):
         """Show modern genre chart."""
-        self.clear_charts()
-        
-        chart_canvas = self.visualizer.create_modern_genre_chart(self.charts_container)
-        if chart_canvas:
-            chart_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            self.current_charts.append(chart_canvas)
+        self.show_chart('genre')
     
     def show_modern_trend_chart(self):
         """Show modern trend chart."""
-        self.clear_charts()
-        
-        chart_canvas = self.visualizer.create_modern_trend_chart(self.charts_container)
-        if chart_canvas:
-            chart_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            self.current_charts.append(chart_canvas)
+        self.show_chart('trend')
     
     def show_modern_revenue_chart(self):
         """Show modern revenue chart."""
-        self.clear_charts()
-        
-        chart_canvas = self.visualizer.create_modern_revenue_chart(self.charts_container)
-        if chart_canvas:
-            chart_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            self.current_charts.append(chart_canvas)
+        self.show_chart('revenue')
     
     def show_metrics_dashboard(self):
         """Show modern metrics dashboard."""
-        self.clear_charts()
-        
-        chart_canvas = self.visualizer.create_modern_metrics_dashboard(self.charts_container)
-        if chart_canvas:
-            chart_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            self.current_charts.append(chart_canvas)
+        self.show_chart('dashboard')
     
     def refresh_charts(self):
         """Refresh all charts with latest data."""
-        if self.current_charts:
-            # For now, just re-create the current chart type
-            current_method_name = None
-            if hasattr(self.visualizer, 'create_modern_genre_chart'):
-                current_method_name = 'create_modern_genre_chart'
-            elif hasattr(self.visualizer, 'create_modern_trend_chart'):
-                current_method_name = 'create_modern_trend_chart'
-            elif hasattr(self.visualizer, 'create_modern_revenue_chart'):
-                current_method_name = 'create_modern_revenue_chart'
-            elif hasattr(self.visualizer, 'create_modern_metrics_dashboard'):
-                current_method_name = 'create_modern_metrics_dashboard'
-            
-            if current_method_name:
-                current_method = getattr(self.visualizer, current_method_name)
-                self.clear_charts()
-                chart_canvas = current_method(self.charts_container)
-                if chart_canvas:
-                    chart_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-                    self.current_charts.append(chart_canvas)
-        
-        messagebox.showinfo("Refresh", "Charts updated with latest data!")
+        self.visualizer.invalidate()
+        if self._current_chart_kind:
+            self.show_chart(self._current_chart_kind, refresh=True)
+    
+    def _get_exporter(self):
+        """Create the report exporter on first use."""
+        if self.exporter is None:
+            from utils.exporters import ReportExporter
+            self.exporter = ReportExporter()
+        return self.exporter
     
     def export_current_rentals(self):
         """Export current rentals report."""
-        success, message, file_path = self.exporter.export_current_rentals()
+        success, message, file_path = self._get_exporter().export_current_rentals()
         if success:
             self.show_export_success(message, file_path)
         else:
@@ -241,7 +293,7 @@ class ReportsView(ttk.Frame):
     
     def export_overdue_rentals(self):
         """Export overdue rentals report."""
-        success, message, file_path = self.exporter.export_overdue_rentals()
+        success, message, file_path = self._get_exporter().export_overdue_rentals()
         if success:
             self.show_export_success(message, file_path)
         else:
@@ -249,7 +301,7 @@ class ReportsView(ttk.Frame):
     
     def export_genre_stats(self):
         """Export genre statistics report."""
-        success, message, file_path = self.exporter.export_rental_stats_by_genre()
+        success, message, file_path = self._get_exporter().export_rental_stats_by_genre()
         if success:
             self.show_export_success(message, file_path)
         else:
@@ -257,7 +309,7 @@ class ReportsView(ttk.Frame):
     
     def export_monthly_trends(self):
         """Export monthly trends report."""
-        success, message, file_path = self.exporter.export_monthly_rental_trends()
+        success, message, file_path = self._get_exporter().export_monthly_rental_trends()
         if success:
             self.show_export_success(message, file_path)
         else:
@@ -265,7 +317,7 @@ class ReportsView(ttk.Frame):
     
     def export_comprehensive(self):
         """Export comprehensive report."""
-        success, message, file_path = self.exporter.export_comprehensive_report()
+        success, message, file_path = self._get_exporter().export_comprehensive_report()
         if success:
             self.show_export_success(message, file_path)
         else:
@@ -281,11 +333,7 @@ class ReportsView(ttk.Frame):
         
         if result and file_path:
             try:
-                # Open the file with default application
-                if os.name == 'nt':  # Windows
-                    os.startfile(file_path)
-                elif os.name == 'posix':  # macOS, Linux
-                    os.system(f'open "{file_path}"' if os.uname().sysname == 'Darwin' else f'xdg-open "{file_path}"')
+                _open_file(file_path)
             except Exception as e:
                 logger.error(f"Failed to open file: {e}")
                 messagebox.showinfo("File Location", f"File saved to:\n{file_path}")
\ No newline at end of file
@@ -3,7 +3,9 @@ Excel export functionality for reports
 """
 
 import pandas as pd
+import xlsxwriter
 import os
+from dataclasses import dataclass
 from datetime import datetime
 import logging
 from models.rental_model import RentalModel
@@ -12,6 +14,58 @@ from models.customer_model import CustomerModel
 
 logger = logging.getLogger(__name__)
 
+# Columns kept as floats in the DataFrame and shown as currency by Excel
+MONEY_COLUMNS = frozenset({'Total Charge', 'Late Fee', 'Total Revenue', 'Average Revenue per Rental'})
+MONEY_FORMAT = '$#,##0.00'
+
+# Model row key -> sheet heading, in sheet order, shared by the rental listings
+RENTAL_SHEET_COLUMNS = {
+    'rental_id': 'Rental ID',
+    'customer_name': 'Customer',
+    'movie_title': 'Movie',
+    'rental_date_s': 'Rental Date',
+    'due_date_s': 'Due Date',
+    'days_overdue': 'Days Overdue'
+}
+
+
+@dataclass
+class _ReportCache:
+    """Rows fetched during one export call, shared by the sheets it builds."""
+    all_rentals: list = None
+    active_rentals: list = None
+    overdue_rentals: list = None
+    movies: list = None
+
+
+@dataclass(frozen=True)
+class _ReportSpec:
+    """How one single-sheet report is fetched, built and named."""
+    sources: tuple  # _ReportCache fields passed to the builder, in order
+    builder: str  # ReportExporter method turning the rows into a DataFrame
+    sheet_name: str
+    prefix: str
+    label: str
+    empty_message: str
+
+
+# Report kind -> spec; also the sheet order of the comprehensive report
+REPORTS = {
+    'current_rentals': _ReportSpec(
+        ('active_rentals',), '_build_current_rentals_df',
+        'Current Rentals', 'current_rentals', 'Current rentals', "No active rentals found"),
+    'overdue_rentals': _ReportSpec(
+        ('overdue_rentals',), '_build_overdue_rentals_df',
+        'Overdue Rentals', 'overdue_rentals', 'Overdue rentals', "No overdue rentals found"),
+    'genre_stats': _ReportSpec(
+        ('all_rentals', 'movies'), '_build_genre_stats_df',
+        'Rental Stats by Genre', 'rental_stats_by_genre', 'Rental stats by genre', "No rental data found"),
+    'monthly_trends': _ReportSpec(
+        ('all_rentals',), '_build_monthly_trends_df',
+        'Monthly Trends', 'monthly_rental_trends', 'Monthly rental trends', "No rental data found")
+}
+
+
 class ReportExporter:
     """Handles exporting reports to Excel format."""
     
@@ -20,137 +74,210 @@ class ReportExporter:
         self.movie_model = MovieModel()
         self.customer_model = CustomerModel()
         self.reports_dir = "reports"
+        self._sources = {
+            'active_rentals': self.rental_model.get_active_rentals,
+            'overdue_rentals': lambda: self.rental_model.search_rentals(status='overdue'),
+            'all_rentals': self.rental_model.search_rentals,
+            'movies': self.movie_model.get_all_movies
+        }
         
         # Create reports directory if it doesn't exist
         if not os.path.exists(self.reports_dir):
             os.makedirs(self.reports_dir)
     
-    def export_current_rentals(self):
+    def _fetch(self, cache, name):
         """
-        Export currently rented movies to Excel.
+        Return the rows cached under name, fetching them on a miss.
         
+        Args:
+            cache: _ReportCache of the current export call
+            name: _ReportCache field to read and fill
+            
         Returns:
-            tuple: (success: bool, message: str, file_path: str)
+            tuple: (success: bool, message: str, rows: list)
         """
+        rows = getattr(cache, name)
+        if rows is not None:
+            return True, "Loaded from cache", rows
+        
+        success, message, rows = self._sources[name]()
+        if success:
+            setattr(cache, name, rows)
+        return success, message, rows
+    
+    @staticmethod
+    def _autofit_columns(worksheet, df, money_format=None):
+        """Size each column to its longest value or header, capped at 50 characters, and format money columns."""
+        for index, column in enumerate(df.columns):
+            lengths = df[column].astype(str).str.len()
+            max_length = max(int(lengths.max()) if len(lengths) else 0, len(str(column)))
+            column_format = money_format if column in MONEY_COLUMNS else None
+            worksheet.set_column(index, index, min(max_length + 2, 50), column_format)
+    
+    def _write_report(self, prefix, sheets):
+        """
+        Write one or more DataFrames into a single timestamped workbook.
+        
+        Args:
+            prefix: File name prefix, e.g. 'current_rentals'
+            sheets: Iterable of (sheet_name, DataFrame) pairs
+            
+        Returns:
+            tuple: (filename: str, file_path: str)
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"{prefix}_{timestamp}.xlsx"
+        file_path = os.path.join(self.reports_dir, filename)
+        
+        # constant_memory flushes each row as soon as the next one starts, so
+        # rows are streamed in order here; DataFrame.to_excel writes
+        # column by column and would lose all but the last column.
+        workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True})
         try:
-            success, message, rentals = self.rental_model.get_active_rentals()
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+            money_format = workbook.add_format({'num_format': MONEY_FORMAT})
+            for sheet_name, df in sheets:
+                worksheet = workbook.add_worksheet(sheet_name)
+                self._autofit_columns(worksheet, df, money_format)
+                worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+                for row_index, row in enumerate(df.itertuples(index=False, name=None), start=1):
+                    worksheet.write_row(row_index, 0, row)
+        finally:
+            workbook.close()
+        
+        return filename, file_path
+    
+    def _build_current_rentals_df(self, rentals):
+        """Build the Current Rentals sheet from active rental rows."""
+        columns = {**RENTAL_SHEET_COLUMNS, 'total_charge': 'Total Charge', 'employee_name': 'Employee'}
+        df = pd.DataFrame(rentals, columns=list(columns)).rename(columns=columns)
+        df['Total Charge'] = pd.to_numeric(df['Total Charge'], errors='coerce').fillna(0.0)
+        return df
+    
+    def _build_overdue_rentals_df(self, rentals):
+        """Build the Overdue Rentals sheet from overdue rental rows."""
+        columns = {**RENTAL_SHEET_COLUMNS, 'phone': 'Customer Phone', 'email': 'Customer Email'}
+        df = pd.DataFrame(rentals, columns=list(columns)).rename(columns=columns)
+        df.insert(df.columns.get_loc('Days Overdue') + 1, 'Late Fee',
+                  (df['Days Overdue'] * self.rental_model.late_fee_per_day).astype(float))
+        df[['Customer Phone', 'Customer Email']] = df[['Customer Phone', 'Customer Email']].fillna('N/A')
+        return df
+    
+    def _build_genre_stats_df(self, rentals, movies):
+        """Build the per-genre statistics sheet from rental and movie rows."""
+        merged = pd.DataFrame(rentals, columns=['rental_id', 'movie_id', 'rental_status', 'total_charge'])
+        genre_by_movie = pd.DataFrame(movies, columns=['movie_id', 'genre']).set_index('movie_id')['genre']
+        
+        # One hashed lookup per rental instead of joining the two frames
+        merged['genre'] = merged['movie_id'].map(genre_by_movie).fillna('Unknown')
+        merged['revenue'] = pd.to_numeric(merged['total_charge'], errors='coerce').fillna(0.0)
+        merged['is_active'] = merged['rental_status'].eq('active')
+        merged['is_overdue'] = merged['rental_status'].eq('overdue')
+        
+        stats = merged.groupby('genre').agg(
+            total_rentals=('rental_id', 'count'),
+            active_rentals=('is_active', 'sum'),
+            overdue_rentals=('is_overdue', 'sum'),
+            total_revenue=('revenue', 'sum')
+        ).sort_values('total_rentals', ascending=False)
+        average_revenue = stats['total_revenue'] / stats['total_rentals']
+        
+        return pd.DataFrame({
+            'Genre': stats.index,
+            'Total Rentals': stats['total_rentals'].to_numpy(),
+            'Active Rentals': stats['active_rentals'].to_numpy(),
+            'Overdue Rentals': stats['overdue_rentals'].to_numpy(),
+            'Total Revenue': stats['total_revenue'].to_numpy(),
+            'Average Revenue per Rental': average_revenue.to_numpy()
+        })
+    
+    def _build_monthly_trends_df(self, rentals):
+        """Build the monthly trends sheet from rental rows."""
+        rentals_df = pd.DataFrame(rentals, columns=['rental_id', 'rental_date', 'total_charge', 'customer_id', 'movie_id'])
+        rentals_df['month'] = pd.to_datetime(rentals_df['rental_date']).dt.strftime('%Y-%m')
+        rentals_df['revenue'] = pd.to_numeric(rentals_df['total_charge'], errors='coerce').fillna(0.0)
+        
+        monthly = rentals_df.groupby('month').agg(
+            rental_count=('rental_id', 'count'),
+            total_revenue=('revenue', 'sum'),
+            unique_customers=('customer_id', 'nunique'),
+            unique_movies=('movie_id', 'nunique')
+        ).sort_index()
+        average_revenue = monthly['total_revenue'] / monthly['rental_count']
+        
+        return pd.DataFrame({
+            'Month': monthly.index,
+            'Rental Count': monthly['rental_count'].to_numpy(),
+            'Total Revenue': monthly['total_revenue'].to_numpy(),
+            'Unique Customers': monthly['unique_customers'].to_numpy(),
+            'Unique Movies': monthly['unique_movies'].to_numpy(),
+            'Average Revenue per Rental': average_revenue.to_numpy()
+        })
+    
+    def _fetch_sources(self, spec, cache):
+        """
+        Fetch every source a report needs, stopping at the first failure.
+        
+        Args:
+            spec: _ReportSpec from REPORTS
+            cache: _ReportCache of the current export call
+            
+        Returns:
+            tuple: (success: bool, message: str, rows: list of row lists in spec order)
+        """
+        rows = []
+        for name in spec.sources:
+            success, message, source_rows = self._fetch(cache, name)
             if not success:
                 return False, message, None
-            
-            if not rentals:
-                return False, "No active rentals found", None
-            
-            # Create DataFrame
-            df_data = []
-            for rental in rentals:
-                df_data.append({
-                    'Rental ID': rental['rental_id'],
-                    'Customer': f"{rental['customer_first_name']} {rental['customer_last_name']}",
-                    'Movie': rental['movie_title'],
-                    'Rental Date': rental['rental_date'].strftime('%Y-%m-%d'),
-                    'Due Date': rental['due_date'].strftime('%Y-%m-%d'),
-                    'Days Overdue': max(0, (datetime.now().date() - rental['due_date']).days),
-                    'Total Charge': f"${rental['total_charge']:.2f}",
-                    'Employee': rental['employee_name']
-                })
-            
-            df = pd.DataFrame(df_data)
-            
-            # Generate filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"current_rentals_{timestamp}.xlsx"
-            file_path = os.path.join(self.reports_dir, filename)
-            
-            # Export to Excel
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Current Rentals', index=False)
-                
-                # Auto-adjust columns width
-                worksheet = writer.sheets['Current Rentals']
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            logger.info(f"Current rentals exported to: {file_path}")
-            return True, f"Report exported successfully: {filename}", file_path
-            
-        except Exception as e:
-            logger.error(f"Export current rentals failed: {e}")
-            return False, f"Export failed: {str(e)}", None
+            if not rows and not source_rows:
+                return False, spec.empty_message, None
+            rows.append(source_rows)
+        return True, "Report data loaded", rows
     
-    def export_overdue_rentals(self):
+    def _run_export(self, spec):
         """
-        Export overdue rentals to Excel.
+        Fetch, build and write one single-sheet report.
         
+        Args:
+            spec: _ReportSpec from REPORTS
+            
         Returns:
             tuple: (success: bool, message: str, file_path: str)
         """
         try:
-            success, message, rentals = self.rental_model.get_overdue_rentals()
+            success, message, rows = self._fetch_sources(spec, _ReportCache())
             if not success:
                 return False, message, None
             
-            if not rentals:
-                return False, "No overdue rentals found", None
-            
-            # Create DataFrame
-            df_data = []
-            for rental in rentals:
-                days_overdue = (datetime.now().date() - rental['due_date']).days
-                late_fee = days_overdue * 2.00  # $2 per day
-                
-                df_data.append({
-                    'Rental ID': rental['rental_id'],
-                    'Customer': f"{rental['customer_first_name']} {rental['customer_last_name']}",
-                    'Movie': rental['movie_title'],
-                    'Rental Date': rental['rental_date'].strftime('%Y-%m-%d'),
-                    'Due Date': rental['due_date'].strftime('%Y-%m-%d'),
-                    'Days Overdue': days_overdue,
-                    'Late Fee': f"${late_fee:.2f}",
-                    'Customer Phone': rental.get('phone', 'N/A'),
-                    'Customer Email': rental.get('email', 'N/A')
-                })
+            df = getattr(self, spec.builder)(*rows)
+            filename, file_path = self._write_report(spec.prefix, [(spec.sheet_name, df)])
             
-            df = pd.DataFrame(df_data)
-            
-            # Generate filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"overdue_rentals_{timestamp}.xlsx"
-            file_path = os.path.join(self.reports_dir, filename)
-            
-            # Export to Excel
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Overdue Rentals', index=False)
-                
-                # Auto-adjust columns width
-                worksheet = writer.sheets['Overdue Rentals']
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            logger.info(f"Overdue rentals exported to: {file_path}")
+            logger.info(f"{spec.label} exported to: {file_path}")
             return True, f"Report exported successfully: {filename}", file_path
             
         except Exception as e:
-            logger.error(f"Export overdue rentals failed: {e}")
+            logger.error(f"Export {spec.label.lower()} failed: {e}")
             return False, f"Export failed: {str(e)}", None
     
+    def export_current_rentals(self):
+        """
+        Export currently rented movies to Excel.
+        
+        Returns:
+            tuple: (success: bool, message: str, file_path: str)
+        """
+        return self._run_export(REPORTS['current_rentals'])
+    
+    def export_overdue_rentals(self):
+        """
+        Export overdue rentals to Excel.
+        
+        Returns:
+            tuple: (success: bool, message: str, file_path: str)
+        """
+        return self._run_export(REPORTS['overdue_rentals'])
+    
     def export_rental_stats_by_genre(self):
         """
         Export rental statistics by genre to Excel.
@@ -158,84 +285,7 @@ class ReportExporter:
         Returns:
             tuple: (success: bool, message: str, file_path: str)
         """
-        try:
-            # Get all rentals
-            success, message, rentals = self.rental_model.search_rentals()
-            if not success:
-                return False, message, None
-            
-            # Get movie details for genre information
-            movie_success, movie_message, movies = self.movie_model.get_all_movies()
-            if not movie_success:
-                return False, movie_message, None
-            
-            # Create movie genre mapping
-            movie_genres = {movie['movie_id']: movie.get('genre', 'Unknown') for movie in movies}
-            
-            # Calculate statistics by genre
-            genre_stats = {}
-            for rental in rentals:
-                genre = movie_genres.get(rental['movie_id'], 'Unknown')
-                if genre not in genre_stats:
-                    genre_stats[genre] = {
-                        'total_rentals': 0,
-                        'total_revenue': 0.0,
-                        'active_rentals': 0,
-                        'overdue_rentals': 0
-                    }
-                
-                genre_stats[genre]['total_rentals'] += 1
-                genre_stats[genre]['total_revenue'] += float(rental['total_charge'] or 0)
-                
-                if rental['rental_status'] == 'active':
-                    genre_stats[genre]['active_rentals'] += 1
-                elif rental['rental_status'] == 'overdue':
-                    genre_stats[genre]['overdue_rentals'] += 1
-            
-            # Create DataFrame
-            df_data = []
-            for genre, stats in genre_stats.items():
-                df_data.append({
-                    'Genre': genre,
-                    'Total Rentals': stats['total_rentals'],
-                    'Active Rentals': stats['active_rentals'],
-                    'Overdue Rentals': stats['overdue_rentals'],
-                    'Total Revenue': f"${stats['total_revenue']:.2f}",
-                    'Average Revenue per Rental': f"${stats['total_revenue']/stats['total_rentals']:.2f}" if stats['total_rentals'] > 0 else "$0.00"
-                })
-            
-            df = pd.DataFrame(df_data)
-            df = df.sort_values('Total Rentals', ascending=False)
-            
-            # Generate filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"rental_stats_by_genre_{timestamp}.xlsx"
-            file_path = os.path.join(self.reports_dir, filename)
-            
-            # Export to Excel
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Rental Stats by Genre', index=False)
-                
-                # Auto-adjust columns width
-                worksheet = writer.sheets['Rental Stats by Genre']
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            logger.info(f"Rental stats by genre exported to: {file_path}")
-            return True, f"Report exported successfully: {filename}", file_path
-            
-        except Exception as e:
-            logger.error(f"Export rental stats by genre failed: {e}")
-            return False, f"Export failed: {str(e)}", None
+        return self._run_export(REPORTS['genre_stats'])
     
     def export_monthly_rental_trends(self):
         """
@@ -244,125 +294,36 @@ class ReportExporter:
         Returns:
             tuple: (success: bool, message: str, file_path: str)
         """
-        try:
-            success, message, rentals = self.rental_model.search_rentals()
-            if not success:
-                return False, message, None
-            
-            if not rentals:
-                return False, "No rental data found", None
-            
-            # Group by month
-            monthly_data = {}
-            for rental in rentals:
-                rental_date = rental['rental_date']
-                month_key = rental_date.strftime('%Y-%m')
-                
-                if month_key not in monthly_data:
-                    monthly_data[month_key] = {
-                        'rental_count': 0,
-                        'total_revenue': 0.0,
-                        'unique_customers': set(),
-                        'unique_movies': set()
-                    }
-                
-                monthly_data[month_key]['rental_count'] += 1
-                monthly_data[month_key]['total_revenue'] += float(rental['total_charge'] or 0)
-                monthly_data[month_key]['unique_customers'].add(rental['customer_id'])
-                monthly_data[month_key]['unique_movies'].add(rental['movie_id'])
-            
-            # Create DataFrame
-            df_data = []
-            for month, data in sorted(monthly_data.items()):
-                df_data.append({
-                    'Month': month,
-                    'Rental Count': data['rental_count'],
-                    'Total Revenue': f"${data['total_revenue']:.2f}",
-                    'Unique Customers': len(data['unique_customers']),
-                    'Unique Movies': len(data['unique_movies']),
-                    'Average Revenue per Rental': f"${data['total_revenue']/data['rental_count']:.2f}" if data['rental_count'] > 0 else "$0.00"
-                })
-            
-            df = pd.DataFrame(df_data)
-            
-            # Generate filename
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"monthly_rental_trends_{timestamp}.xlsx"
-            file_path = os.path.join(self.reports_dir, filename)
-            
-            # Export to Excel
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Monthly Trends', index=False)
-                
-                # Auto-adjust columns width
-                worksheet = writer.sheets['Monthly Trends']
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            logger.info(f"Monthly rental trends exported to: {file_path}")
-            return True, f"Report exported successfully: {filename}", file_path
-            
-        except Exception as e:
-            logger.error(f"Export monthly trends failed: {e}")
-            return False, f"Export failed: {str(e)}", None
+        return self._run_export(REPORTS['monthly_trends'])
     
     def export_comprehensive_report(self):
         """
-        Export a comprehensive report with multiple sheets.
+        Export a comprehensive report with one sheet per report kind.
+        
+        Each source is fetched once and every sheet goes into the same
+        workbook; reports with no rows are left out.
         
         Returns:
             tuple: (success: bool, message: str, file_path: str)
         """
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"comprehensive_report_{timestamp}.xlsx"
-            file_path = os.path.join(self.reports_dir, filename)
+            cache = _ReportCache()
+            sheets = []
+            for spec in REPORTS.values():
+                success, message, rows = self._fetch_sources(spec, cache)
+                if success:
+                    sheets.append((spec.sheet_name, getattr(self, spec.builder)(*rows)))
+                elif message != spec.empty_message:
+                    return False, message, None
+            
+            if not sheets:
+                return False, "No rental data found", None
             
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                # Export each report as a separate sheet
-                reports = [
-                    ('Current Rentals', self.export_current_rentals),
-                    ('Overdue Rentals', self.export_overdue_rentals),
-                    ('Genre Statistics', self.export_rental_stats_by_genre),
-                    ('Monthly Trends', self.export_monthly_rental_trends)
-                ]
-                
-                for sheet_name, export_func in reports:
-                    success, message, _ = export_func()
-                    if success:
-                        # For comprehensive report, we need to recreate the data
-                        if sheet_name == 'Current Rentals':
-                            success, message, rentals = self.rental_model.get_active_rentals()
-                            if success and rentals:
-                                df_data = []
-                                for rental in rentals:
-                                    df_data.append({
-                                        'Rental ID': rental['rental_id'],
-                                        'Customer': f"{rental['customer_first_name']} {rental['customer_last_name']}",
-                                        'Movie': rental['movie_title'],
-                                        'Rental Date': rental['rental_date'].strftime('%Y-%m-%d'),
-                                        'Due Date': rental['due_date'].strftime('%Y-%m-%d'),
-                                        'Days Overdue': max(0, (datetime.now().date() - rental['due_date']).days),
-                                        'Total Charge': f"${rental['total_charge']:.2f}"
-                                    })
-                                df = pd.DataFrame(df_data)
-                                df.to_excel(writer, sheet_name=sheet_name, index=False)
-                        
-                        # Similar logic for other sheets...
-                        # (Implementation simplified for brevity)
+            filename, file_path = self._write_report('comprehensive_report', sheets)
             
             logger.info(f"Comprehensive report exported to: {file_path}")
             return True, f"Comprehensive report exported: {filename}", file_path
             
         except Exception as e:
             logger.error(f"Export comprehensive report failed: {e}")
-            return False, f"Export failed: {str(e)}", None
\ No newline at end of file
+            return False, f"Export failed: {str(e)}", None
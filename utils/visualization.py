@@ -3,24 +3,72 @@ Modern data visualization using matplotlib with contemporary styling.
 """
 
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.artist import setp
+from matplotlib.colors import ListedColormap
+from matplotlib.patches import Circle
 import matplotlib
 matplotlib.use('Agg')
+import numpy as np
 import pandas as pd
 import tkinter as tk
+import time
 from datetime import datetime
 import logging
 from models.rental_model import RentalModel
-from models.movie_model import MovieModel
 
 logger = logging.getLogger(__name__)
 
+CHART_CACHE_TTL = 5  # seconds
+TREND_MAX_POINTS = 200  # longer monthly series are downsampled before plotting
+TREND_MAX_ANNOTATIONS = 40  # value labels are skipped beyond this many points
+
+# matplotlib style and rcParams are process-wide, so they only need applying once
+_STYLE_APPLIED = False
+
+
+def _lttb(x, y, n_out):
+    """
+    Pick n_out indices of the series (x, y) with Largest-Triangle-Three-Buckets.
+    
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the average of the next bucket.
+    
+    Returns:
+        numpy.ndarray: Sorted indices into x and y
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)  # n_out - 2 inner buckets
+    indices = [0]
+    kept = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        areas = np.abs((x[kept] - avg_x) * (y[start:end] - y[kept])
+                       - (x[kept] - x[start:end]) * (avg_y - y[kept]))
+        kept = start + int(np.argmax(areas))
+        indices.append(kept)
+    indices.append(n - 1)
+    return np.array(indices)
+
+
 class ModernDataVisualizer:
     """Modern data visualization with contemporary styling."""
     
     def __init__(self):
         self.rental_model = RentalModel()
-        self.movie_model = MovieModel()
+        self._cache = {}  # fetch name -> (monotonic time, (success, message, rows))
         
         # Modern color palette
         self.colors = {
@@ -32,14 +80,27 @@ class ModernDataVisualizer:
             'error': '#e63946',
             'dark': '#1d3557',
             'light': '#f1faee',
-            'gray': '#a8dadc'
+            'gray': '#a8dadc',
+            'border': '#dee2e6'
         }
         
+        # Message box style for _create_empty_chart
+        self._empty_bbox = dict(boxstyle="round,pad=0.3", facecolor=self.colors['light'],
+                                edgecolor=self.colors['border'], alpha=0.7)
+        
+        # Wedge colors for the genre donut, cycled when there are more genres
+        self._genre_cmap = ListedColormap([self.colors[key] for key in
+                                           ('primary', 'secondary', 'accent', 'success', 'warning', 'gray')])
+        
         # Modern matplotlib style
         self.set_modern_style()
     
     def set_modern_style(self):
         """Configure modern matplotlib style."""
+        global _STYLE_APPLIED
+        if _STYLE_APPLIED:
+            return
+        
         plt.style.use('seaborn-v0_8-whitegrid')
         
         # Customize rcParams for modern look
@@ -60,42 +121,79 @@ class ModernDataVisualizer:
             'axes.labelsize': 11,
             'legend.fontsize': 10
         })
+        
+        _STYLE_APPLIED = True
+    
+    def _cached(self, name, fetch):
+        """Return a successful fetch made within CHART_CACHE_TTL, otherwise fetch again."""
+        cached = self._cache.get(name)
+        if cached is not None and time.monotonic() - cached[0] < CHART_CACHE_TTL:
+            return cached[1]
+        
+        result = fetch()
+        if result[0]:
+            self._cache[name] = (time.monotonic(), result)
+        return result
     
-    def create_modern_genre_chart(self, parent):
-        """Create modern rentals by genre donut chart."""
+    def _get_monthly_totals(self):
+        """Get per-month rental totals aggregated by the database, shared for a few seconds."""
+        return self._cached('monthly_totals', self.rental_model.get_monthly_rental_totals)
+    
+    def _get_genre_totals(self):
+        """Get per-genre rental totals aggregated by the database, shared for a few seconds."""
+        return self._cached('genre_totals', self.rental_model.get_genre_rental_totals)
+    
+    def _get_status_totals(self):
+        """Get per-status rental totals aggregated by the database, shared for a few seconds."""
+        return self._cached('status_totals', self.rental_model.get_rental_status_totals)
+    
+    def _get_charge_counts(self):
+        """Get rental counts per total charge from the database, shared for a few seconds."""
+        return self._cached('charge_counts', self.rental_model.get_rental_charge_counts)
+    
+    def invalidate(self):
+        """Drop cached rows so the next chart reads fresh data."""
+        self._cache.clear()
+    
+    def get_genre_chart_data(self):
+        """
+        Count rentals per genre for the genre chart.
+        
+        Returns:
+            tuple: (success: bool, message: str, data: dict with genres and counts)
+        """
         try:
-            success, message, rentals = self.rental_model.search_rentals()
-            if not success or not rentals:
-                return self._create_empty_chart(parent, "No rental data available")
-            
-            movie_success, movie_message, movies = self.movie_model.get_all_movies()
-            if not movie_success:
-                return self._create_empty_chart(parent, "No movie data available")
+            success, message, totals = self._get_genre_totals()
+            if not success or not totals:
+                return False, "No rental data available", None
             
-            # Count rentals by genre
-            movie_genres = {}
-            for movie in movies:
-                movie_genres[movie['movie_id']] = movie.get('genre', 'Unknown')
+            # Rentals per genre, counted by the database, most rented first
+            genre_totals = pd.DataFrame(totals, columns=['genre', 'rental_count'])
             
-            genre_counts = {}
-            for rental in rentals:
-                genre = movie_genres.get(rental['movie_id'], 'Unknown')
-                genre_counts[genre] = genre_counts.get(genre, 0) + 1
+            return True, "Genre data loaded", {
+                'genres': genre_totals['genre'].tolist(),
+                'counts': genre_totals['rental_count'].to_numpy()
+            }
             
-            if not genre_counts:
-                return self._create_empty_chart(parent, "No genre data available")
+        except Exception as e:
+            logger.error(f"Get genre chart data failed: {e}")
+            return False, f"Error creating chart: {str(e)}", None
+    
+    def create_modern_genre_chart(self, fig, result=None):
+        """Draw modern rentals by genre donut chart into fig from get_genre_chart_data() output."""
+        try:
+            if result is None:
+                result = self.get_genre_chart_data()
+            success, message, data = result
+            if not success:
+                return self._create_empty_chart(fig, message)
             
-            # Prepare data
-            genres = list(genre_counts.keys())
-            counts = list(genre_counts.values())
+            genres = data['genres']
+            counts = data['counts']
             
             # Create modern donut chart
-            fig, ax = plt.subplots(figsize=(10, 8))
-            
-            # Use modern color palette
-            colors = [self.colors['primary'], self.colors['secondary'], 
-                     self.colors['accent'], self.colors['success'],
-                     self.colors['warning'], self.colors['gray']]
+            fig.clear()
+            ax = fig.add_subplot()
             
             # Create donut chart
             wedges, texts, autotexts = ax.pie(
@@ -103,13 +201,13 @@ class ModernDataVisualizer:
                 labels=genres,
                 autopct='%1.1f%%',
                 startangle=90,
-                colors=colors[:len(genres)],
+                colors=self._genre_cmap(np.arange(len(genres)) % self._genre_cmap.N),
                 wedgeprops={'edgecolor': 'white', 'linewidth': 2},
                 textprops={'fontsize': 10, 'color': self.colors['dark']}
             )
             
             # Draw circle in the center for donut effect
-            centre_circle = plt.Circle((0,0), 0.70, fc='white')
+            centre_circle = Circle((0,0), 0.70, fc='white')
             ax.add_artist(centre_circle)
             
             # Style the chart
@@ -120,51 +218,63 @@ class ModernDataVisualizer:
                         pad=20)
             
             # Improve text appearance
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-                autotext.set_fontsize(9)
+            setp(autotexts, color='white', fontweight='bold', fontsize=9)
             
             # Equal aspect ratio ensures pie is drawn as circle
             ax.axis('equal')
-            plt.tight_layout()
             
-            # Embed in Tkinter
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.draw()
-            
-            return canvas
+            return fig
             
         except Exception as e:
             logger.error(f"Create modern genre chart failed: {e}")
-            return self._create_empty_chart(parent, f"Error creating chart: {str(e)}")
+            return self._create_empty_chart(fig, f"Error creating chart: {str(e)}")
     
-    def create_modern_trend_chart(self, parent):
-        """Create modern monthly trend chart with gradient fill."""
+    def get_trend_chart_data(self):
+        """
+        Count rentals per month for the trend chart.
+        
+        Returns:
+            tuple: (success: bool, message: str, data: dict with months and counts)
+        """
         try:
-            success, message, rentals = self.rental_model.search_rentals()
-            if not success or not rentals:
-                return self._create_empty_chart(parent, "No rental data available")
-            
-            # Group by month
-            monthly_data = {}
-            for rental in rentals:
-                rental_date = rental['rental_date']
-                month_key = rental_date.strftime('%Y-%m')
-                
-                if month_key not in monthly_data:
-                    monthly_data[month_key] = 0
-                monthly_data[month_key] += 1
-            
-            # Sort by month
-            sorted_months = sorted(monthly_data.keys())
-            counts = [monthly_data[month] for month in sorted_months]
+            success, message, totals = self._get_monthly_totals()
+            if not success or not totals:
+                return False, "No rental data available", None
+            
+            # Rentals per month, grouped by the database, oldest first
+            monthly = pd.DataFrame(totals, columns=['month', 'rental_count'])
+            sorted_months = monthly['month'].tolist()
+            counts = monthly['rental_count'].to_numpy(dtype=np.int32)
             
             if len(sorted_months) < 2:
-                return self._create_empty_chart(parent, "Insufficient data for trend analysis")
+                return False, "Insufficient data for trend analysis", None
+            
+            if len(counts) > TREND_MAX_POINTS:
+                keep = _lttb(np.arange(len(counts)), counts, TREND_MAX_POINTS)
+                sorted_months = [sorted_months[i] for i in keep]
+                counts = counts[keep]
+            
+            return True, "Trend data loaded", {'months': sorted_months, 'counts': counts}
+            
+        except Exception as e:
+            logger.error(f"Get trend chart data failed: {e}")
+            return False, f"Error creating chart: {str(e)}", None
+    
+    def create_modern_trend_chart(self, fig, result=None):
+        """Draw modern monthly trend chart with gradient fill into fig from get_trend_chart_data() output."""
+        try:
+            if result is None:
+                result = self.get_trend_chart_data()
+            success, message, data = result
+            if not success:
+                return self._create_empty_chart(fig, message)
+            
+            sorted_months = data['months']
+            counts = data['counts']
             
             # Create modern area chart
-            fig, ax = plt.subplots(figsize=(12, 6))
+            fig.clear()
+            ax = fig.add_subplot()
             
             # Create gradient fill under line
             ax.fill_between(sorted_months, counts, alpha=0.3, color=self.colors['primary'])
@@ -194,69 +304,68 @@ class ModernDataVisualizer:
             ax.set_axisbelow(True)
             
             # Rotate x-axis labels
-            plt.xticks(rotation=45, ha='right')
+            ax.tick_params(axis='x', labelrotation=45)
+            for label in ax.get_xticklabels():
+                label.set_horizontalalignment('right')
             
             # Remove spines
             for spine in ax.spines.values():
                 spine.set_visible(False)
             
-            # Add value annotations with modern style
-            for i, (month, count) in enumerate(zip(sorted_months, counts)):
-                ax.annotate(str(count), (month, count), 
-                           textcoords="offset points", 
-                           xytext=(0,10), 
-                           ha='center', 
-                           fontsize=9,
-                           fontweight='bold',
-                           color=self.colors['dark'])
+            # Add value labels with modern style, unless they would crowd the chart
+            if len(counts) <= TREND_MAX_ANNOTATIONS:
+                offset = counts.max() * 0.02
+                labels = [ax.text(month, count + offset, str(count), ha='center', va='bottom')
+                          for month, count in zip(sorted_months, counts)]
+                setp(labels, fontsize=9, fontweight='bold', color=self.colors['dark'])
             
-            plt.tight_layout()
-            
-            # Embed in Tkinter
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.draw()
-            
-            return canvas
+            return fig
             
         except Exception as e:
             logger.error(f"Create modern trend chart failed: {e}")
-            return self._create_empty_chart(parent, f"Error creating chart: {str(e)}")
+            return self._create_empty_chart(fig, f"Error creating chart: {str(e)}")
     
-    def create_modern_revenue_chart(self, parent):
-        """Create modern horizontal bar chart for revenue by genre."""
+    def get_revenue_chart_data(self):
+        """
+        Sum rental revenue per genre for the revenue chart, largest first.
+        
+        Returns:
+            tuple: (success: bool, message: str, data: dict with genres and revenues)
+        """
         try:
-            success, message, rentals = self.rental_model.search_rentals()
-            if not success or not rentals:
-                return self._create_empty_chart(parent, "No rental data available")
-            
-            movie_success, movie_message, movies = self.movie_model.get_all_movies()
-            if not movie_success:
-                return self._create_empty_chart(parent, "No movie data available")
+            success, message, totals = self._get_genre_totals()
+            if not success or not totals:
+                return False, "No rental data available", None
             
-            # Calculate revenue by genre
-            movie_genres = {}
-            for movie in movies:
-                movie_genres[movie['movie_id']] = movie.get('genre', 'Unknown')
+            # Revenue per genre, summed by the database, largest first
+            genre_totals = pd.DataFrame(totals, columns=['genre', 'revenue'])
+            genre_totals['revenue'] = genre_totals['revenue'].astype(float)
+            genre_totals = genre_totals.sort_values('revenue', ascending=False)
             
-            genre_revenue = {}
-            for rental in rentals:
-                genre = movie_genres.get(rental['movie_id'], 'Unknown')
-                revenue = float(rental['total_charge'] or 0)
-                genre_revenue[genre] = genre_revenue.get(genre, 0) + revenue
+            return True, "Revenue data loaded", {
+                'genres': genre_totals['genre'].tolist(),
+                'revenues': genre_totals['revenue'].to_numpy()
+            }
             
-            if not genre_revenue:
-                return self._create_empty_chart(parent, "No revenue data available")
-            
-            # Prepare data and sort by revenue
-            genres = list(genre_revenue.keys())
-            revenues = list(genre_revenue.values())
+        except Exception as e:
+            logger.error(f"Get revenue chart data failed: {e}")
+            return False, f"Error creating chart: {str(e)}", None
+    
+    def create_modern_revenue_chart(self, fig, result=None):
+        """Draw modern horizontal bar chart for revenue by genre into fig from get_revenue_chart_data() output."""
+        try:
+            if result is None:
+                result = self.get_revenue_chart_data()
+            success, message, data = result
+            if not success:
+                return self._create_empty_chart(fig, message)
             
-            # Sort by revenue (descending)
-            sorted_data = sorted(zip(genres, revenues), key=lambda x: x[1], reverse=True)
-            genres, revenues = zip(*sorted_data) if sorted_data else ([], [])
+            genres = data['genres']
+            revenues = data['revenues']
             
             # Create modern horizontal bar chart
-            fig, ax = plt.subplots(figsize=(12, 8))
+            fig.clear()
+            ax = fig.add_subplot()
             
             # Create gradient bars
             bars = ax.barh(genres, revenues, 
@@ -290,82 +399,125 @@ class ModernDataVisualizer:
             for spine in ax.spines.values():
                 spine.set_visible(False)
             
-            # Tight layout
-            plt.tight_layout()
-            
-            # Embed in Tkinter
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.draw()
-            
-            return canvas
+            return fig
             
         except Exception as e:
             logger.error(f"Create modern revenue chart failed: {e}")
-            return self._create_empty_chart(parent, f"Error creating chart: {str(e)}")
+            return self._create_empty_chart(fig, f"Error creating chart: {str(e)}")
+    
+    def get_dashboard_data(self):
+        """
+        Collect status counts, recent monthly counts, top genres and revenues for the dashboard.
+        
+        Every panel is built from database aggregates, so no rental rows are
+        transferred; revenues are the distinct charges, weighted by their counts.
+        
+        Returns:
+            tuple: (success: bool, message: str, data: dict)
+        """
+        try:
+            success, message, status_totals = self._get_status_totals()
+            if not success or not status_totals:
+                return False, "No rental data available", None
+            
+            charge_success, charge_message, charge_counts = self._get_charge_counts()
+            if not charge_success:
+                return False, charge_message, None
+            
+            monthly_success, monthly_message, monthly_totals = self._get_monthly_totals()
+            if not monthly_success:
+                return False, monthly_message, None
+            
+            genre_success, genre_message, genre_totals = self._get_genre_totals()
+            if not genre_success:
+                return False, genre_message, None
+            
+            # Rental status (simplified pie), main statuses first even when zero
+            status_df = pd.DataFrame(status_totals, columns=['rental_status', 'rental_count'])
+            status_counts = status_df.groupby(status_df['rental_status'].str.title())['rental_count'].sum()
+            statuses = ['Active', 'Returned', 'Overdue']
+            statuses += [status for status in status_counts.index if status not in statuses]
+            status_counts = status_counts.reindex(statuses, fill_value=0)
+            
+            # Monthly trend (mini), last 6 months
+            monthly = pd.DataFrame(monthly_totals, columns=['month', 'rental_count']).tail(6)
+            
+            # Top genres, already ordered most rented first
+            top_genres = pd.DataFrame(genre_totals, columns=['genre', 'rental_count']).head(5)
+            
+            # Revenue distribution, one row per distinct charge
+            charges = pd.DataFrame(charge_counts, columns=['total_charge', 'rental_count'])
+            
+            return True, "Dashboard data loaded", {
+                'statuses': status_counts.index.tolist(),
+                'status_counts': status_counts.to_numpy(),
+                'months': monthly['month'].tolist(),
+                'counts': monthly['rental_count'].to_numpy(dtype=np.int32),
+                'top_genres': top_genres['genre'].tolist(),
+                'top_genre_counts': top_genres['rental_count'].to_numpy(),
+                'revenues': pd.to_numeric(charges['total_charge']).to_numpy(dtype=np.float32),
+                'revenue_counts': charges['rental_count'].to_numpy()
+            }
+            
+        except Exception as e:
+            logger.error(f"Get dashboard data failed: {e}")
+            return False, f"Error creating dashboard: {str(e)}", None
     
-    def create_modern_metrics_dashboard(self, parent):
-        """Create a modern metrics dashboard with multiple charts."""
+    def create_modern_metrics_dashboard(self, fig, result=None):
+        """Draw a modern metrics dashboard with multiple charts into fig from get_dashboard_data() output."""
         try:
+            if result is None:
+                result = self.get_dashboard_data()
+            success, message, data = result
+            if not success:
+                return self._create_empty_chart(fig, message)
+            
             # Create a 2x2 grid of charts
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+            fig.clear()
+            ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
             fig.suptitle('Rental Analytics Dashboard', fontsize=20, fontweight='bold', 
-                        color=self.colors['dark'], y=0.95)
-            
-            # Get data
-            success, message, rentals = self.rental_model.search_rentals()
-            if not success or not rentals:
-                return self._create_empty_chart(parent, "No rental data available")
+                        color=self.colors['dark'])
             
             # Chart 1: Rental status (simplified pie)
-            status_counts = {'Active': 0, 'Returned': 0, 'Overdue': 0}
-            for rental in rentals:
-                status = rental['rental_status'].title()
-                status_counts[status] = status_counts.get(status, 0) + 1
-            
-            ax1.pie(status_counts.values(), labels=status_counts.keys(), 
+            ax1.pie(data['status_counts'], labels=data['statuses'], 
                    autopct='%1.1f%%', colors=[self.colors['primary'], self.colors['success'], self.colors['error']])
             ax1.set_title('Rental Status', fontweight='bold')
             
             # Chart 2: Monthly trend (mini)
-            monthly_data = {}
-            for rental in rentals:
-                month_key = rental['rental_date'].strftime('%Y-%m')
-                monthly_data[month_key] = monthly_data.get(month_key, 0) + 1
-            
-            sorted_months = sorted(monthly_data.keys())[-6:]  # Last 6 months
-            counts = [monthly_data[month] for month in sorted_months]
+            sorted_months = data['months']
+            counts = data['counts']
             
             ax2.plot(sorted_months, counts, marker='o', color=self.colors['primary'])
             ax2.set_title('Recent Trends (6 Months)', fontweight='bold')
             ax2.tick_params(axis='x', rotation=45)
             
-            # Chart 3: Top genres (horizontal bars)
-            # ... implementation similar to previous methods
+            # Chart 3: Top genres (horizontal bars), most rented on top
+            ax3.barh(data['top_genres'][::-1], data['top_genre_counts'][::-1],
+                    color=self.colors['secondary'], alpha=0.8, height=0.6)
+            ax3.set_title('Top Genres', fontweight='bold')
+            ax3.set_xlabel('Rentals')
             
             # Chart 4: Revenue distribution
-            revenues = [float(r['total_charge'] or 0) for r in rentals]
-            ax4.hist(revenues, bins=10, color=self.colors['primary'], alpha=0.7)
+            revenues = data['revenues']
+            ax4.hist(revenues, bins=10, weights=data['revenue_counts'],
+                    color=self.colors['primary'], alpha=0.7)
             ax4.set_title('Revenue Distribution', fontweight='bold')
             ax4.set_xlabel('Revenue ($)')
             ax4.set_ylabel('Frequency')
             
-            plt.tight_layout(rect=[0, 0, 1, 0.95])
-            
-            canvas = FigureCanvasTkAgg(fig, parent)
-            canvas.draw()
-            return canvas
+            return fig
             
         except Exception as e:
             logger.error(f"Create metrics dashboard failed: {e}")
-            return self._create_empty_chart(parent, f"Error creating dashboard: {str(e)}")
+            return self._create_empty_chart(fig, f"Error creating dashboard: {str(e)}")
     
-    def _create_empty_chart(self, parent, message):
-        """Create a modern empty chart with message."""
-        fig, ax = plt.subplots(figsize=(8, 6))
+    def _create_empty_chart(self, fig, message):
+        """Draw a modern empty chart with message into fig."""
+        fig.clear()
+        ax = fig.add_subplot()
         ax.text(0.5, 0.5, message, ha='center', va='center', 
                transform=ax.transAxes, fontsize=12, style='italic',
-               bbox=dict(boxstyle="round,pad=0.3", facecolor=self.colors['light'], 
-                        edgecolor=self.colors['border'], alpha=0.7))
+               bbox=self._empty_bbox)
         ax.set_xticks([])
         ax.set_yticks([])
         
@@ -373,6 +525,4 @@ class ModernDataVisualizer:
         for spine in ax.spines.values():
             spine.set_visible(False)
         
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
-        return canvas
\ No newline at end of file
+        return fig
\ No newline at end of file